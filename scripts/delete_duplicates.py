@@ -4,14 +4,19 @@ from typing import List, Optional
 from loguru import logger
 from google.oauth2.service_account import Credentials
 from google.auth.exceptions import DefaultCredentialsError, TransportError
+from gspread.utils import rowcol_to_a1
 
 from cas_alert.config import settings
 from cas_alert.data.models import Alert
 from cas_alert.data.processor import DataProcessor
 
+# Above this many duplicates it is cheaper to rewrite the sheet (clear + update)
+# than to delete the duplicate row ranges individually
+REWRITE_THRESHOLD = 20
+
 
 class GoogleSheetsManager:
-    \"\"\"Handles interaction with Google Sheets\"\"\"
+    """Handles interaction with Google Sheets"""
 
     def __init__(self):
         self.client: Optional[gspread.Client] = None
@@ -20,7 +25,7 @@ class GoogleSheetsManager:
         self.processor = DataProcessor()  # Use DataProcessor for DataFrame conversion
 
     def authenticate(self):
-        \"\"\"Authenticate with Google Sheets using service account credentials\"\"\"
+        """Authenticate with Google Sheets using service account credentials"""
         # Define the scope
         scope = [
             'https://www.googleapis.com/auth/spreadsheets',
@@ -54,7 +59,7 @@ class GoogleSheetsManager:
             raise
 
     def open_sheet_and_worksheet(self):
-        \"\"\"Open the specified Google Sheet and Worksheet\"\"\"
+        """Open the specified Google Sheet and Worksheet"""
         if not self.client:
             logger.error("Google Sheets client not authenticated.")
             return
@@ -78,7 +83,7 @@ class GoogleSheetsManager:
             raise
 
     def get_all_data(self):
-        \"\"\"Retrieve all data from the Google Sheet\"\"\"
+        """Retrieve all data from the Google Sheet"""
         if not self.worksheet:
             logger.warning("Worksheet not available to retrieve data.")
             return None
@@ -93,29 +98,90 @@ class GoogleSheetsManager:
             logger.error(f"Error retrieving data from Google Sheets: {e}")
             return None
 
+    def get_column_values(self, header: str) -> Optional[List[str]]:
+        """Retrieve a single column's values (excluding the header row) by header name"""
+        if not self.worksheet:
+            logger.warning("Worksheet not available to retrieve data.")
+            return None
+
+        try:
+            # Resolve the column letter from the header row, then fetch only that column
+            headers = self.worksheet.row_values(1)
+            column = rowcol_to_a1(1, headers.index(header) + 1).rstrip('0123456789')
+            values = self.worksheet.get(f"{column}2:{column}", value_render_option='UNFORMATTED_VALUE')
+            # Blank cells come back as empty rows
+            column_values = [str(row[0]) if row else '' for row in values]
+            logger.info(f"Retrieved {len(column_values)} '{header}' values from Google Sheets.")
+            return column_values
+
+        except Exception as e:
+            logger.error(f"Error retrieving '{header}' column from Google Sheets: {e}")
+            return None
+
     def delete_rows(self, row_indices: List[int]):
-        \"\"\"Delete rows from the Google Sheet by index\"\"\"
+        """Delete rows from the Google Sheet by index"""
         if not self.worksheet:
             logger.error("Worksheet not available to delete rows.")
             return
 
+        if not row_indices:
+            return
+
         try:
-            # Delete rows in reverse order to avoid index shifting
-            for row_index in sorted(row_indices, reverse=True):
-                self.worksheet.delete_rows(row_index)
-                logger.info(f"Deleted row {row_index} from Google Sheets.")
-            logger.success(f"Successfully deleted {len(row_indices)} rows from Google Sheets.")
+            # Group adjacent rows into [start, end] runs, highest rows first so
+            # earlier deletions don't shift the indices of later ones
+            ranges = []
+            for row_index in sorted(set(row_indices), reverse=True):
+                if ranges and ranges[-1][0] == row_index + 1:
+                    ranges[-1][0] = row_index
+                else:
+                    ranges.append([row_index, row_index])
+
+            # One batchUpdate request containing a deleteDimension per run
+            requests = [
+                {
+                    "deleteDimension": {
+                        "range": {
+                            "sheetId": self.worksheet.id,
+                            "dimension": "ROWS",
+                            "startIndex": start - 1,  # 0-based, inclusive
+                            "endIndex": end,  # 0-based, exclusive
+                        }
+                    }
+                }
+                for start, end in ranges
+            ]
+            self.sheet.batch_update({"requests": requests})
+            logger.success(f"Successfully deleted {len(row_indices)} rows ({len(ranges)} ranges) from Google Sheets.")
 
         except Exception as e:
             logger.error(f"Error deleting rows from Google Sheets: {e}")
 
+    def replace_all_data(self, rows: List[List[str]]):
+        """Replace the worksheet contents with the given rows (header included)"""
+        if not self.worksheet:
+            logger.error("Worksheet not available to replace data.")
+            return
+
+        try:
+            # Overwrite from the top first, then clear only the leftover rows below, so the sheet
+            # is never empty if a request fails. USER_ENTERED re-parses dates as update_with_new_alerts writes them.
+            self.worksheet.update(range_name='A1', values=rows, value_input_option='USER_ENTERED')
+            if len(rows) < self.worksheet.row_count:
+                self.worksheet.batch_clear([f"{len(rows) + 1}:{self.worksheet.row_count}"])
+            logger.success(f"Successfully rewrote Google Sheets with {len(rows)} rows.")
+
+        except Exception as e:
+            logger.error(f"Error replacing data in Google Sheets: {e}")
+
 
 def delete_duplicates():
-    \"\"\"
+    """
     Loads the Google Sheet, identifies duplicate rows based on the 'Hash ID' column,
     and deletes them from the sheet.
-    \"\"\"
+    """
     logger.info("Starting duplicate deletion process...")
+    settings.ensure_dirs()
 
     # Initialize GoogleSheetsManager
     sheets_manager = GoogleSheetsManager()
@@ -129,31 +195,18 @@ def delete_duplicates():
             logger.error("Could not open the worksheet. Aborting.")
             return
 
-        # Retrieve all data
-        data = sheets_manager.get_all_data()
-        if not data:
+        # Retrieve only the 'Hash ID' column; the rest of the sheet isn't needed to find duplicates
+        hash_ids_column = sheets_manager.get_column_values('Hash ID')
+        if hash_ids_column is None:
             logger.error("Could not retrieve data from the worksheet. Aborting.")
             return
 
-        # Extract headers and data rows
-        headers = data[0]
-        data_rows = data[1:]
-
-        # Find the index of the 'Hash ID' column
-        hash_id_index = headers.index('Hash ID')
-
-        # Identify duplicate rows based on 'Hash ID'
-        hash_ids = {}
-        duplicate_row_indices = []
-        for i, row in enumerate(data_rows):
-            row_index = i + 2  # Add 2 to account for header row and 0-based indexing
-            hash_id = row[hash_id_index]
-
-            if hash_id in hash_ids:
-                duplicate_row_indices.append(row_index)
-                logger.debug(f"Found duplicate Hash ID: {hash_id} at row {row_index}")
-            else:
-                hash_ids[hash_id] = row_index
+        # Identify duplicate rows based on 'Hash ID' (first occurrence is kept).
+        # Series.duplicated runs the hash-table scan in C rather than a Python loop.
+        is_duplicate = pd.Series(hash_ids_column, dtype=object).duplicated(keep='first')
+        # Add 2 to account for header row and 0-based indexing
+        duplicate_row_indices = (is_duplicate[is_duplicate].index + 2).tolist()
+        logger.debug(f"Duplicate rows: {duplicate_row_indices}")
 
         if not duplicate_row_indices:
             logger.info("No duplicate rows found in the Google Sheet.")
@@ -161,8 +214,23 @@ def delete_duplicates():
 
         logger.info(f"Found {len(duplicate_row_indices)} duplicate rows. Deleting...")
 
-        # Delete duplicate rows
-        sheets_manager.delete_rows(duplicate_row_indices)
+        if len(duplicate_row_indices) > REWRITE_THRESHOLD:
+            # Rewrite the deduplicated sheet in two API calls, regardless of duplicate count
+            data = sheets_manager.get_all_data()
+            if not data:
+                logger.error("Could not retrieve data from the worksheet. Aborting.")
+                return
+
+            headers = data[0]
+            data_rows = data[1:]
+            duplicate_rows = set(duplicate_row_indices)
+            kept_rows = [headers] + [
+                row for i, row in enumerate(data_rows) if i + 2 not in duplicate_rows
+            ]
+            sheets_manager.replace_all_data(kept_rows)
+        else:
+            # Delete duplicate rows
+            sheets_manager.delete_rows(duplicate_row_indices)
 
         logger.success("Duplicate deletion process completed.")
 
@@ -9,5 +9,10 @@ setup(
     name='cas-alert',
     description="Code snippet manager for Jupyter Notebook & Notebook enhancements + data science helper functions",
     packages=find_packages(),  # It will find all packages in your directory
-    install_requires=requirements  # This is the key line to install dependencies
+    install_requires=requirements,  # This is the key line to install dependencies
+    extras_require={
+        'macos': ['pyobjc-framework-Cocoa'],  # In-process notifications instead of osascript
+        'lsh': ['datasketch>=2.0.0'],  # MinHash near-duplicate detection against the sheet
+        'fastjson': ['orjson>=3.9.0'],  # Faster serialisation of Google Sheets append payloads
+    },
 )
@@ -8,8 +8,8 @@ from dotenv import load_dotenv
 # Load environment variables
 load_dotenv()
 
-# Project root directory
-PROJECT_ROOT = Path(__file__).parent.parent.parent.parent
+# Project root directory (settings.py -> config -> cas_alert -> src -> root)
+PROJECT_ROOT = Path(__file__).resolve().parents[3]
 
 # Google Sheets Configuration
 GOOGLE_SHEETS_CREDENTIALS_PATH = os.getenv('GOOGLE_SHEETS_CREDENTIALS_PATH', 'secrests/google_sheets_secret.json')
@@ -17,13 +17,19 @@ GOOGLE_SHEET_ID = os.getenv('GOOGLE_SHEET_ID', '1Jyg7rbPwtGIYG039j0CkNh7gA5lf6JR
 GOOGLE_WORKSHEET_NAME = os.getenv('GOOGLE_WORKSHEET_NAME', 'CAS_Alerts')
 
 # Scraping Configuration
-SCRAPE_DELAY_SECONDS = int(os.getenv('SCRAPE_DELAY_SECONDS', '2'))
 MAX_RETRIES = int(os.getenv('MAX_RETRIES', '3'))
+MAX_BACKOFF_SECONDS = int(os.getenv('MAX_BACKOFF_SECONDS', '30'))
 TIMEOUT_SECONDS = int(os.getenv('TIMEOUT_SECONDS', '30'))
 USER_AGENT = os.getenv('USER_AGENT', 'CAS-Alert-Scraper/1.0')
+ENRICH_CONCURRENCY = int(os.getenv('ENRICH_CONCURRENCY', '8'))  # Parallel detail-page fetches
+RATE_LIMIT_PER_SECOND = float(os.getenv('RATE_LIMIT_PER_SECOND', '4'))  # Sustained requests/second per site; 0 disables
+RATE_LIMIT_BURST = int(os.getenv('RATE_LIMIT_BURST', '8'))  # Requests allowed back-to-back before throttling
+DETAIL_CACHE_DAYS = int(os.getenv('DETAIL_CACHE_DAYS', '30'))  # Alert detail pages don't change once issued; 0 disables
 
 # Data Processing
 DUPLICATE_THRESHOLD = float(os.getenv('DUPLICATE_THRESHOLD', '0.85'))
+NEAR_DUPLICATE_THRESHOLD = float(os.getenv('NEAR_DUPLICATE_THRESHOLD', '0.95'))  # MinHash Jaccard vs rows in the sheet; 0 disables
+MINHASH_NUM_PERM = int(os.getenv('MINHASH_NUM_PERM', '128'))
 MAX_ALERTS_PER_RUN = int(os.getenv('MAX_ALERTS_PER_RUN', '1000'))
 BACKUP_ENABLED = os.getenv('BACKUP_ENABLED', 'true').lower() == 'true'
 
@@ -44,8 +50,10 @@ GOVUK_ALERTS_URL = 'https://www.gov.uk/drug-device-alerts'
 DATA_DIR = PROJECT_ROOT / 'data'
 BACKUP_DIR = DATA_DIR / 'backups'
 LOGS_DIR = PROJECT_ROOT / 'logs'
+DEDUP_DB_PATH = Path(os.getenv('DEDUP_DB_PATH', DATA_DIR / 'dedup_index.sqlite3'))  # Keys already written to the sheet
 
-# Ensure directories exist
-DATA_DIR.mkdir(exist_ok=True)
-BACKUP_DIR.mkdir(exist_ok=True)
-LOGS_DIR.mkdir(exist_ok=True)
+
+def ensure_dirs():
+    """Create data/log directories; called from entry points rather than at import time"""
+    for directory in (DATA_DIR, BACKUP_DIR, LOGS_DIR):
+        directory.mkdir(parents=True, exist_ok=True)
@@ -1,12 +1,32 @@
 """
 Duplicate detection and handling for CAS Alert Scraper
 """
-from typing import List
+import functools
+from collections import defaultdict
+from typing import Dict, Iterable, List, Optional, Tuple
+import numpy as np
 from loguru import logger
-from fuzzywuzzy import fuzz
+from rapidfuzz import fuzz, process
 
 from .models import Alert
 from ..config import settings
+from ..utils.text import collapse_whitespace
+
+# Character shingle length for MinHash near-duplicate detection
+SHINGLE_SIZE = 5
+# Stored signatures are only comparable with ones built from the same seed and permutation scheme
+MINHASH_SEED = 1
+MINHASH_SCHEME = 'affine32'
+
+
+@functools.lru_cache(maxsize=1)
+def _datasketch():
+    """Return the datasketch module, or None if it isn't installed (the optional 'lsh' extra)"""
+    try:
+        import datasketch
+    except ImportError:
+        return None
+    return datasketch
 
 
 class DuplicateManager:
@@ -25,21 +45,37 @@ class DuplicateManager:
             logger.debug(f"Exact reference match: {alert1.reference}")
             return True
 
-        # 2. High similarity on title and same source
-        if alert1.source == alert2.source:
-            title_similarity = fuzz.ratio(alert1.title.lower(), alert2.title.lower())
-            if title_similarity >= self.duplicate_threshold * 100: # fuzz.ratio returns 0-100
-                 # Check if dates are close (e.g., within a few days)
-                 # For simplicity, let's check if dates are the same for now
-                 if alert1.issue_date.date() == alert2.issue_date.date():
-                    logger.debug(f"High title similarity ({title_similarity}%) and same date/source: '{alert1.title}' vs '{alert2.title}'")
-                    return True
-
-        # 3. Exact match on hash_id (covers reference, title, originator, date)
+        # 2. Exact match on hash_id (covers reference, title, originator, date)
         if alert1.hash_id and alert1.hash_id == alert2.hash_id:
              logger.debug(f"Exact hash ID match: {alert1.hash_id}")
              return True
 
+        # 3. High similarity on title, same source and same date
+        return self._fuzzy_duplicate(alert1, alert2)
+
+    def _fuzzy_duplicate(self, alert1: Alert, alert2: Alert) -> bool:
+        """
+        Check only the title-similarity rule: same source, same issue date and
+        a title ratio at or above the duplicate threshold.
+        Assumes the exact reference/hash checks have already been done.
+        """
+        # Cheap equality checks first, so the string comparison only runs when it matters
+        if alert1.source != alert2.source:
+            return False
+        # Check if dates are close (e.g., within a few days)
+        # For simplicity, let's check if dates are the same for now
+        if alert1.issue_date.date() != alert2.issue_date.date():
+            return False
+
+        # fuzz.ratio returns 0-100; with score_cutoff it returns 0 early once the cutoff can't be met.
+        # Scores are rounded before the comparison, as fuzzywuzzy's integer ratios were, so the
+        # cutoff leaves room for scores that round up to the threshold.
+        threshold = self.duplicate_threshold * 100
+        title_similarity = round(fuzz.ratio(alert1.title.lower(), alert2.title.lower(), score_cutoff=threshold - 0.5))
+        if title_similarity >= threshold:
+            logger.debug(f"High title similarity ({title_similarity:.0f}%) and same date/source: '{alert1.title}' vs '{alert2.title}'")
+            return True
+
         return False
 
     def remove_duplicates(self, alerts: List[Alert]) -> List[Alert]:
@@ -66,36 +102,43 @@ class DuplicateManager:
             if alert.hash_id:
                  seen_hashes.add(alert.hash_id)
 
-        # Now check for duplicates based on title similarity among the remaining unique alerts
-        # This is an O(N^2) operation, so might be slow for very large datasets
-        # A more efficient approach for very large datasets would involve clustering or indexing
-        # For this scale, pairwise comparison should be acceptable.
+        # Now check for duplicates based on title similarity among the remaining unique alerts.
+        # Exact reference/hash matches were handled above, so only the fuzzy title check
+        # (_fuzzy_duplicate) is left, and that requires the same source and issue date. Bucket by
+        # (source, date) first so pairwise comparisons only happen within each bucket.
+        buckets = defaultdict(list)
+        for index, alert in enumerate(unique_alerts):
+            buckets[(alert.source, alert.issue_date.date())].append(index)
+
+        # Lowercase titles once rather than on both sides of every comparison
+        titles = [alert.title.lower() for alert in unique_alerts]
+        threshold = self.duplicate_threshold * 100  # fuzz.ratio returns 0-100
 
-        final_unique_alerts: List[Alert] = []
         processed_indices = set()
 
-        for i in range(len(unique_alerts)):
-            if i in processed_indices:
+        for indices in buckets.values():
+            if len(indices) < 2:
                 continue
 
-            current_alert = unique_alerts[i]
-            is_duplicate_found = False
-
-            for j in range(i + 1, len(unique_alerts)):
-                if j in processed_indices:
+            # Score every title pair in the bucket in one vectorised call; scores below the
+            # cutoff come back as 0. Rounded as in _fuzzy_duplicate.
+            bucket_titles = [titles[i] for i in indices]
+            scores = np.round(process.cdist(
+                bucket_titles, bucket_titles,
+                scorer=fuzz.ratio, score_cutoff=threshold - 0.5, workers=-1
+            ))
+
+            # Upper-triangle pairs (a < b) in row order, matching the original i < j scan
+            for a, b in np.argwhere(np.triu(scores >= threshold, k=1)):
+                i, j = indices[a], indices[b]
+                if i in processed_indices or j in processed_indices:
                     continue
 
-                other_alert = unique_alerts[j]
-
-                if self.is_duplicate(current_alert, other_alert):
-                    logger.debug(f"Identified potential duplicate: '{current_alert.title}' vs '{other_alert.title}'")
-                    # Decide which one to keep - maybe the one with more complete data or newer scraped_at?
-                    # For now, we'll just mark the second one as processed and keep the first.
-                    processed_indices.add(j)
-                    is_duplicate_found = True # Mark that a duplicate of current_alert was found
-
-            final_unique_alerts.append(current_alert)
+                logger.debug(f"Identified potential duplicate ({scores[a, b]:.0f}%): '{unique_alerts[i].title}' vs '{unique_alerts[j].title}'")
+                # Keep the first occurrence and mark the later one as processed
+                processed_indices.add(j)
 
+        final_unique_alerts = [alert for index, alert in enumerate(unique_alerts) if index not in processed_indices]
 
         logger.info(f"Removed {len(alerts) - len(final_unique_alerts)} duplicates.")
         return final_unique_alerts
@@ -108,3 +151,98 @@ class DuplicateManager:
         """
         logger.debug(f"Merging duplicates (keeping first): {alert1.reference or alert1.title}")
         return alert1 # Simple merge: keep the first one
+
+
+class NearDuplicateIndex:
+    """
+    MinHash LSH index over each alert's title, originator and issue date.
+    Catches reworded or re-spaced copies of alerts already in the sheet, which the exact
+    hash ID/reference checks miss, without comparing against every existing row.
+    """
+
+    def __init__(self, datasketch, threshold: float, num_perm: int):
+        self._datasketch = datasketch
+        self.threshold = threshold
+        self.num_perm = num_perm
+        self.lsh = datasketch.MinHashLSH(threshold=threshold, num_perm=num_perm)
+        # Indexed signatures by key, to check LSH candidates (MinHashLSH.insert also rejects known keys)
+        self.minhashes = {}
+        # Generating the permutations is the expensive part of creating a MinHash; do it once
+        self._permutations = datasketch.MinHash(num_perm=num_perm, seed=MINHASH_SEED, scheme=MINHASH_SCHEME).permutations
+
+    @classmethod
+    def create(cls) -> Optional['NearDuplicateIndex']:
+        """A new index, or None if near-duplicate detection is disabled or datasketch isn't installed"""
+        if settings.NEAR_DUPLICATE_THRESHOLD <= 0:
+            return None
+        datasketch = _datasketch()
+        if datasketch is None:
+            logger.debug("datasketch not installed; near-duplicate detection is disabled.")
+            return None
+        return cls(datasketch, settings.NEAR_DUPLICATE_THRESHOLD, settings.MINHASH_NUM_PERM)
+
+    def signature(self, title: str, originator: str, issue_date: str):
+        """
+        MinHash of the character shingles of title, originator and issue date.
+        issue_date is an ISO 8601 string; only the date part is used.
+        """
+        text = collapse_whitespace(f"{title} {originator} {issue_date[:10]}").lower()
+        shingles = {text[i:i + SHINGLE_SIZE] for i in range(max(1, len(text) - SHINGLE_SIZE + 1))}
+        minhash = self._datasketch.MinHash(
+            num_perm=self.num_perm, seed=MINHASH_SEED, permutations=self._permutations, scheme=MINHASH_SCHEME
+        )
+        minhash.update_batch([shingle.encode() for shingle in shingles])
+        return minhash
+
+    def alert_signature(self, alert: Alert):
+        """MinHash of an alert"""
+        return self.signature(alert.title, alert.originator, alert.issue_date.isoformat())
+
+    def query(self, minhash) -> List[Tuple[str, float]]:
+        """
+        (key, estimated Jaccard similarity) of indexed signatures at or above the threshold, most
+        similar first. LSH only returns likely candidates, so each one's estimate is checked.
+        """
+        matches = []
+        for key in self.lsh.query(minhash):
+            similarity = minhash.jaccard(self.minhashes[key])
+            if similarity >= self.threshold:
+                matches.append((key, similarity))
+        return sorted(matches, key=lambda match: match[1], reverse=True)
+
+    def insert(self, key: str, minhash):
+        """Index a signature under key (a hash ID); keys already indexed are ignored"""
+        if key not in self.minhashes:
+            self.lsh.insert(key, minhash)
+            self.minhashes[key] = minhash
+
+    def to_bytes(self, minhash) -> bytes:
+        """Compact form of a signature for the local dedup store (LeanMinHash's own format)"""
+        lean = self._datasketch.LeanMinHash(minhash)
+        buffer = bytearray(lean.bytesize())
+        lean.serialize(buffer)
+        return bytes(buffer)
+
+    def load(self, signatures: Dict[str, bytes]) -> bool:
+        """
+        Index stored signatures. Returns False if any was built with other MinHash settings,
+        in which case the index has to be rebuilt from the sheet.
+        """
+        restored = {key: self._datasketch.LeanMinHash.deserialize(blob) for key, blob in signatures.items()}
+        if any(
+            len(minhash.hashvalues) != self.num_perm or minhash.seed != MINHASH_SEED or minhash.scheme != MINHASH_SCHEME
+            for minhash in restored.values()
+        ):
+            return False
+        for key, minhash in restored.items():
+            self.insert(key, minhash)
+        return True
+
+    def build(self, rows: Iterable[Tuple[str, str, str, str]]) -> Dict[str, bytes]:
+        """Index (hash ID, title, originator, issue date) rows; returns their signatures for storing"""
+        signatures = {}
+        for hash_id, title, originator, issue_date in rows:
+            minhash = self.signature(title, originator, issue_date)
+            self.insert(hash_id, minhash)
+            signatures[hash_id] = self.to_bytes(minhash)
+        return signatures
@@ -5,9 +5,63 @@ from dataclasses import dataclass
 from datetime import datetime
 from typing import Optional
 import hashlib
+import sys
 
 
-@dataclass
+# (column name, Alert attribute) pairs, in DataFrame/Google Sheets column order
+COLUMNS = (
+    ('Reference', 'reference'),
+    ('Title', 'title'),
+    ('Originator', 'originator'),
+    ('Issue Date', 'issue_date'),
+    ('Status', 'status'),
+    ('Alert Type', 'alert_type'),
+    ('Source', 'source'),
+    ('URL', 'url'),
+    ('Medical Specialty', 'medical_specialty'),
+    ('Scraped At', 'scraped_at'),
+    ('Hash ID', 'hash_id'),
+    ('Action Category', 'action_category'),
+    ('Broadcast Content', 'broadcast_content'),
+    ('Additional Info', 'additional_info'),
+    ('Action Underway Deadline', 'action_underway_deadline'),
+    ('Action Complete Deadline', 'action_complete_deadline'),
+    ('Attachments', 'attachments'),
+)
+
+# Optional text columns that are written as '' rather than None
+OPTIONAL_TEXT_COLUMNS = (
+    'Medical Specialty', 'Action Category', 'Broadcast Content', 'Additional Info',
+    'Action Underway Deadline', 'Action Complete Deadline', 'Attachments',
+)
+
+
+# Dates are formatted by hand; strftime is much slower for these fixed ISO formats
+def _format_date(d: datetime) -> str:
+    return f"{d.year:04d}-{d.month:02d}-{d.day:02d}"
+
+
+def _format_datetime(d: Optional[datetime]) -> str:
+    if not d:
+        return ''
+    return f"{d.year:04d}-{d.month:02d}-{d.day:02d} {d.hour:02d}:{d.minute:02d}:{d.second:02d}"
+
+
+def _or_empty(value: Optional[str]) -> str:
+    return value or ''
+
+
+def _identity(value):
+    return value
+
+
+_FORMATTERS = {'issue_date': _format_date, 'scraped_at': _format_datetime}
+
+# Slotted instances where dataclass supports it (3.10+); the launchd job runs the system python3, which may be 3.9
+_DATACLASS_OPTIONS = {'slots': True} if sys.version_info >= (3, 10) else {}
+
+
+@dataclass(**_DATACLASS_OPTIONS)
 class Alert:
     """Data model for a CAS alert"""
     reference: str
@@ -30,6 +84,12 @@ class Alert:
     action_complete_deadline: Optional[str] = None
     attachments: Optional[str] = None  # Comma-separated list of attachment names/URLs
 
+    # (column name, attribute, formatter) used by to_dict, built once per class
+    _FIELD_MAP = tuple(
+        (column, attr, _FORMATTERS.get(attr, _or_empty if column in OPTIONAL_TEXT_COLUMNS else _identity))
+        for column, attr in COLUMNS
+    )
+
     def __post_init__(self):
         """Generate hash ID and set scraped_at if not provided"""
         if self.scraped_at is None:
@@ -40,48 +100,35 @@ class Alert:
 
     def generate_hash(self) -> str:
         """Generate a unique hash for duplicate detection"""
-        content = f"{self.reference}|{self.title}|{self.originator}|{self.issue_date.strftime('%Y-%m-%d')}"
-        return hashlib.md5(content.encode()).hexdigest()
+        content = f"{self.reference}|{self.title}|{self.originator}|{_format_date(self.issue_date)}"
+        # Hash IDs are persisted in Google Sheets, so the digest must stay MD5-compatible.
+        # This is a dedup key, not a security boundary.
+        return hashlib.md5(content.encode(), usedforsecurity=False).hexdigest()
 
     def to_dict(self) -> dict:
         """Convert to dictionary for DataFrame/Google Sheets"""
-        return {
-            'Reference': self.reference,
-            'Title': self.title,
-            'Originator': self.originator,
-            'Issue Date': self.issue_date.strftime('%Y-%m-%d'),
-            'Status': self.status,
-            'Alert Type': self.alert_type,
-            'Source': self.source,
-            'URL': self.url,
-            'Medical Specialty': self.medical_specialty or '',
-            'Scraped At': self.scraped_at.strftime('%Y-%m-%d %H:%M:%S') if self.scraped_at else '',
-            'Hash ID': self.hash_id,
-            'Action Category': self.action_category or '',
-            'Broadcast Content': self.broadcast_content or '',
-            'Additional Info': self.additional_info or '',
-            'Action Underway Deadline': self.action_underway_deadline or '',
-            'Action Complete Deadline': self.action_complete_deadline or '',
-            'Attachments': self.attachments or ''
-        }
+        return {column: fmt(getattr(self, attr)) for column, attr, fmt in self._FIELD_MAP}
 
     @classmethod
     def from_dict(cls, data: dict) -> 'Alert':
         """Create Alert from dictionary"""
         issue_date_str = data.get('Issue Date', '')
         scraped_at_str = data.get('Scraped At', '')
+        # Only evaluated once, even if both dates are missing
+        now = datetime.now() if not (issue_date_str and scraped_at_str) else None
 
         return cls(
             reference=data.get('Reference', ''),
             title=data.get('Title', ''),
             originator=data.get('Originator', ''),
-            issue_date=datetime.strptime(issue_date_str, '%Y-%m-%d') if issue_date_str else datetime.now(),
+            # Both sheet formats are ISO 8601, which the C-level fromisoformat parses far faster than strptime
+            issue_date=datetime.fromisoformat(issue_date_str) if issue_date_str else now,
             status=data.get('Status', ''),
             alert_type=data.get('Alert Type', ''),
             source=data.get('Source', ''),
             url=data.get('URL', ''),
             medical_specialty=data.get('Medical Specialty') or None,
-            scraped_at=datetime.strptime(scraped_at_str, '%Y-%m-%d %H:%M:%S') if scraped_at_str else datetime.now(),
+            scraped_at=datetime.fromisoformat(scraped_at_str) if scraped_at_str else now,
             hash_id=data.get('Hash ID'),
             action_category=data.get('Action Category') or None,
             broadcast_content=data.get('Broadcast Content') or None,
@@ -5,7 +5,7 @@ from typing import List
 from loguru import logger
 import pandas as pd
 
-from .models import Alert
+from .models import Alert, COLUMNS, OPTIONAL_TEXT_COLUMNS
 from .duplicates import DuplicateManager
 
 
@@ -36,40 +36,19 @@ class DataProcessor:
         if not alerts:
             return pd.DataFrame()
 
-        # Convert list of Alert objects to list of dictionaries
-        alerts_data = [alert.to_dict() for alert in alerts]
+        # Build one list per column (struct-of-arrays) instead of one dict per alert
+        data = {column: [getattr(alert, attr) for alert in alerts] for column, attr in COLUMNS}
+        for column in OPTIONAL_TEXT_COLUMNS:
+            data[column] = [value or '' for value in data[column]]
 
-        # Create DataFrame
-        df = pd.DataFrame(alerts_data)
-
-        # Ensure columns are in a consistent order
-        column_order = [
-            'Reference', 'Title', 'Originator', 'Issue Date', 'Status',
-            'Alert Type', 'Source', 'URL', 'Medical Specialty', 'Scraped At', 'Hash ID'
-        ]
-        # Add any columns present in the data but not in the order list
-        existing_columns = df.columns.tolist()
-        for col in existing_columns:
-            if col not in column_order:
-                column_order.append(col)
-
-        # Reindex DataFrame to enforce column order
-        df = df.reindex(columns=column_order)
-
-        # Convert 'Issue Date' and 'Scraped At' to datetime objects if they aren't already
+        # Convert 'Issue Date' and 'Scraped At' to datetime columns in one pass each.
+        # Issue dates are day precision and scrape times second precision, as in the sheet.
         # This is useful for sorting and time-based operations later
-        try:
-            df['Issue Date'] = pd.to_datetime(df['Issue Date'], errors='coerce')
-        except Exception as e:
-            logger.warning(f"Could not convert 'Issue Date' to datetime: {e}")
-
-        try:
-            df['Scraped At'] = pd.to_datetime(df['Scraped At'], errors='coerce')
-        except Exception as e:
-            logger.warning(f"Could not convert 'Scraped At' to datetime: {e}")
-
+        data['Issue Date'] = pd.to_datetime(data['Issue Date'], errors='coerce').normalize()
+        data['Scraped At'] = pd.to_datetime(data['Scraped At'], errors='coerce').floor('s')
 
-        return df
+        # Columns are already in a consistent order, so no reindex is needed
+        return pd.DataFrame(data, copy=False)
 
     def dataframe_to_alerts(self, df: pd.DataFrame) -> List[Alert]:
         """Convert a pandas DataFrame to a list of Alert objects"""
@@ -77,12 +56,12 @@ class DataProcessor:
             return []
 
         alerts: List[Alert] = []
-        for index, row in df.iterrows():
+        # to_dict(orient='records') avoids building a Series per row like iterrows() does
+        for record in df.to_dict(orient='records'):
             try:
-                alert = Alert.from_dict(row.to_dict())
-                alerts.append(alert)
+                alerts.append(Alert.from_dict(record))
             except Exception as e:
-                logger.error(f"Error converting DataFrame row to Alert object: {row.to_dict()}. Error: {e}")
+                logger.error(f"Error converting DataFrame row to Alert object: {record}. Error: {e}")
                 continue
 
         return alerts
@@ -1,12 +1,19 @@
 """
 macOS Keychain integration for secure credential storage
 """
+import functools
 import keyring
 from loguru import logger
 import json
 from typing import Optional
 
 
+@functools.lru_cache(maxsize=1)
+def _load_google_credentials_json() -> Optional[str]:
+    """Read the raw credentials JSON from Keychain once per process"""
+    return keyring.get_password(MacOSCredentialManager.SERVICE_NAME, MacOSCredentialManager.USERNAME)
+
+
 class MacOSCredentialManager:
     """Manages secure storage of credentials using macOS Keychain"""
 
@@ -19,6 +26,7 @@ class MacOSCredentialManager:
         try:
             json_string = json.dumps(credentials_json)
             keyring.set_password(MacOSCredentialManager.SERVICE_NAME, MacOSCredentialManager.USERNAME, json_string)
+            _load_google_credentials_json.cache_clear()
             logger.success("Google Sheets credentials successfully stored in macOS Keychain.")
         except Exception as e:
             logger.error(f"Failed to store Google Sheets credentials in Keychain: {e}")
@@ -28,7 +36,7 @@ class MacOSCredentialManager:
     def get_google_credentials() -> Optional[dict]:
         """Retrieve Google Sheets service account credentials from Keychain"""
         try:
-            json_string = keyring.get_password(MacOSCredentialManager.SERVICE_NAME, MacOSCredentialManager.USERNAME)
+            json_string = _load_google_credentials_json()
             if json_string:
                 logger.info("Google Sheets credentials successfully retrieved from macOS Keychain.")
                 return json.loads(json_string)
@@ -42,6 +50,7 @@ class MacOSCredentialManager:
     @staticmethod
     def delete_google_credentials():
         """Delete Google Sheets service account credentials from Keychain"""
+        _load_google_credentials_json.cache_clear()
         try:
             keyring.delete_password(MacOSCredentialManager.SERVICE_NAME, MacOSCredentialManager.USERNAME)
             logger.info("Google Sheets credentials successfully deleted from macOS Keychain.")
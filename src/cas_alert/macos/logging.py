@@ -1,61 +1,105 @@
 """
 macOS native logging for CAS Alert Scraper
 """
+import atexit
+import itertools
 import syslog
+import threading
+from collections import deque
 from loguru import logger
 
 from ..config import settings
 
+# Buffered syslog messages are flushed when this many are queued, or every interval
+SYSLOG_BATCH_SIZE = 64
+SYSLOG_FLUSH_INTERVAL_SECONDS = 0.1
+
 
 class MacOSLogger:
     """Logs messages to macOS system console using syslog"""
 
     def __init__(self):
-        if settings.LOG_TO_CONSOLE:
+        # Per-instance flag, so a syslog failure doesn't change the global settings
+        self._syslog_enabled = settings.LOG_TO_CONSOLE
+        self._buffer = deque()
+        self._lock = threading.Lock()
+        self._wakeup = threading.Event()
+        self._closed = False
+
+        if self._syslog_enabled:
             try:
                 syslog.openlog("cas-alert-scraper", syslog.LOG_PID, syslog.LOG_DAEMON)
                 logger.info("Opened syslog connection for macOS console logging.")
             except Exception as e:
                 logger.error(f"Failed to open syslog connection: {e}")
                 # Fallback to standard loguru logging if syslog fails
-                settings.LOG_TO_CONSOLE = False
+                self._syslog_enabled = False
                 logger.warning("Falling back to standard loguru logging.")
         else:
              logger.info("macOS console logging is disabled in settings.")
 
+        if self._syslog_enabled:
+            # Background writer drains the buffer in batches instead of one syslog call per message
+            threading.Thread(target=self._drain_loop, name="syslog-writer", daemon=True).start()
+            atexit.register(self.close)
+
+    def _drain_loop(self):
+        """Flush buffered messages periodically or when the batch size is reached"""
+        while not self._closed:
+            self._wakeup.wait(SYSLOG_FLUSH_INTERVAL_SECONDS)
+            self._wakeup.clear()
+            self.flush()
+
+    def _enqueue(self, priority: int, message: str):
+        """Queue a message for the background syslog writer"""
+        with self._lock:
+            self._buffer.append((priority, message))
+            if len(self._buffer) >= SYSLOG_BATCH_SIZE:
+                self._wakeup.set()
+
+    def flush(self):
+        """Write all buffered messages to syslog, one call per run of same-priority messages"""
+        # Hold the lock while writing so concurrent flushes keep messages in order
+        with self._lock:
+            batch = list(self._buffer)
+            self._buffer.clear()
+            for priority, entries in itertools.groupby(batch, key=lambda entry: entry[0]):
+                try:
+                    syslog.syslog(priority, "\n".join(message for _, message in entries))
+                except Exception as e:
+                    logger.error(f"Failed to write log batch to syslog: {e}")
 
     def log_info(self, message: str):
         """Log an informational message"""
-        if settings.LOG_TO_CONSOLE:
-            try:
-                syslog.syslog(syslog.LOG_INFO, message)
-            except Exception as e:
-                logger.error(f"Failed to write info log to syslog: {e}")
+        if self._syslog_enabled:
+            self._enqueue(syslog.LOG_INFO, message)
         logger.info(message) # Always log with loguru as well
 
     def log_warning(self, message: str):
         """Log a warning message"""
-        if settings.LOG_TO_CONSOLE:
-            try:
-                syslog.syslog(syslog.LOG_WARNING, message)
-            except Exception as e:
-                logger.error(f"Failed to write warning log to syslog: {e}")
+        if self._syslog_enabled:
+            self._enqueue(syslog.LOG_WARNING, message)
         logger.warning(message) # Always log with loguru as well
 
     def log_error(self, message: str):
         """Log an error message"""
-        if settings.LOG_TO_CONSOLE:
-            try:
-                syslog.syslog(syslog.LOG_ERR, message)
-            except Exception as e:
-                logger.error(f"Failed to write error log to syslog: {e}")
+        if self._syslog_enabled:
+            self._enqueue(syslog.LOG_ERR, message)
         logger.error(message) # Always log with loguru as well
 
+    def close(self):
+        """Flush pending messages and close the syslog connection"""
+        if not self._syslog_enabled or self._closed:
+            return
+
+        self._closed = True
+        self.flush()
+        try:
+            syslog.closelog()
+            logger.info("Closed syslog connection.")
+        except Exception as e:
+            logger.error(f"Failed to close syslog connection: {e}")
+
     def __del__(self):
         """Close syslog connection on object deletion"""
-        if settings.LOG_TO_CONSOLE:
-            try:
-                syslog.closelog()
-                logger.info("Closed syslog connection.")
-            except Exception as e:
-                logger.error(f"Failed to close syslog connection: {e}")
+        self.close()
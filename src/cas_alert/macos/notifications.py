@@ -1,33 +1,80 @@
 """
 macOS native notifications for CAS Alert Scraper
 """
+import functools
 import subprocess
+from typing import List, Optional, Tuple
 from loguru import logger
 
 from ..config import settings
 
 
+def _applescript_string(text: str) -> str:
+    """Quote text as an AppleScript string literal"""
+    return '"' + text.replace('\\', '\\\\').replace('"', '\\"') + '"'
+
+
+@functools.lru_cache(maxsize=1)
+def _native_notification_center():
+    """
+    Return the pyobjc Foundation module and the default NSUserNotificationCenter,
+    or None if pyobjc isn't installed or no center is available (e.g. unbundled process).
+    """
+    try:
+        import Foundation
+    except ImportError:
+        return None
+
+    center = Foundation.NSUserNotificationCenter.defaultUserNotificationCenter()
+    if center is None:
+        return None
+    return Foundation, center
+
+
 class MacOSNotifier:
     """Sends native macOS notifications"""
 
     @staticmethod
-    def send_notification(title: str, message: str, sound: bool = settings.NOTIFICATION_SOUND):
-        """Send a notification using osascript"""
+    def send_notification(title: str, message: str, sound: Optional[bool] = None):
+        """Send a single notification using osascript"""
+        MacOSNotifier.send_notifications([(title, message)], sound=sound)
+
+    @staticmethod
+    def send_notifications(items: List[Tuple[str, str]], sound: Optional[bool] = None):
+        """Send several (title, message) notifications with a single osascript call"""
         if not settings.ENABLE_NOTIFICATIONS:
             logger.info("macOS notifications are disabled in settings.")
             return
 
+        if not items:
+            return
+
+        # Read the setting at call time, not when the function is defined
+        if sound is None:
+            sound = settings.NOTIFICATION_SOUND
+
+        native = _native_notification_center()
+        if native:
+            try:
+                MacOSNotifier._deliver_native(native, items, sound)
+                return
+            except Exception as e:
+                logger.warning(f"Native notification failed, falling back to osascript: {e}")
+
         try:
-            cmd = [
-                'osascript', '-e',
-                f'display notification "{message}" with title "{title}"'
+            script_lines = [
+                f'display notification {_applescript_string(message)} with title {_applescript_string(title)}'
+                for title, message in items
             ]
             if sound:
-                cmd.extend(['-e', 'beep'])
+                script_lines.append('beep')
+
+            cmd = ['osascript', '-e', '\n'.join(script_lines)]
 
             logger.debug(f"Executing notification command: {' '.join(cmd)}")
             subprocess.run(cmd, check=True, capture_output=True, text=True)
-            logger.info(f"Sent notification: '{title}' - '{message}'")
+            for title, message in items:
+                logger.info(f"Sent notification: '{title}' - '{message}'")
 
         except FileNotFoundError:
             logger.error("osascript command not found. Is this running on macOS?")
@@ -35,3 +82,16 @@ class MacOSNotifier:
             logger.error(f"Error sending notification: {e.stderr}")
         except Exception as e:
             logger.error(f"An unexpected error occurred while sending notification: {e}")
+
+    @staticmethod
+    def _deliver_native(native, items: List[Tuple[str, str]], sound: bool):
+        """Deliver notifications in-process through NSUserNotificationCenter"""
+        foundation, center = native
+        for title, message in items:
+            notification = foundation.NSUserNotification.alloc().init()
+            notification.setTitle_(title)
+            notification.setInformativeText_(message)
+            if sound:
+                notification.setSoundName_(foundation.NSUserNotificationDefaultSoundName)
+            center.deliverNotification_(notification)
+            logger.info(f"Sent notification: '{title}' - '{message}'")
@@ -4,12 +4,14 @@ CAS Alert Scraper - Main Entry Point
 Designed for macOS automation via launchd
 """
 import sys
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
 # Ensure project root is on sys.path
 project_root = Path(__file__).parent.parent
 sys.path.insert(0, str(project_root))
 
+from cas_alert.config import settings
 from cas_alert.macos.logging import MacOSLogger
 from cas_alert.macos.notifications import MacOSNotifier
 from cas_alert.scrapers.cas_mhra import CASMHRAScraper
@@ -18,17 +20,21 @@ from cas_alert.data.processor import DataProcessor
 from cas_alert.storage.google_sheets import GoogleSheetsManager
 
 def main():
+    settings.ensure_dirs()
     logger = MacOSLogger()
     notifier = MacOSNotifier()
 
     try:
         logger.log_info("Starting CAS Alert scraping job")
 
-        # Scrape data from both sources
+        # Scrape data from both sources concurrently; both jobs are network-bound
         cas_scraper = CASMHRAScraper()
         govuk_scraper = GOVUKScraper()
-        cas_alerts = cas_scraper.scrape()
-        govuk_alerts = govuk_scraper.scrape()
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            cas_future = executor.submit(cas_scraper.scrape)
+            govuk_future = executor.submit(govuk_scraper.scrape)
+            cas_alerts = cas_future.result()
+            govuk_alerts = govuk_future.result()
 
         # Process and deduplicate alerts
         processor = DataProcessor()
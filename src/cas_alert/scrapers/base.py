@@ -1,43 +1,153 @@
 """
 Base scraper class for CAS Alert Scraper
 """
+import random
+import re
+import threading
 import time
 import requests
+import requests_cache
 from abc import ABC, abstractmethod
-from typing import List, Optional
-from datetime import datetime
-from bs4 import BeautifulSoup
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, List, Optional
+from datetime import datetime, timedelta, timezone
+from email.utils import parsedate_to_datetime
+from urllib.parse import urljoin
+from bs4 import BeautifulSoup, SoupStrainer
 from loguru import logger
+from requests.adapters import HTTPAdapter
 
 from ..config import settings
 from ..data.models import Alert
+from ..utils.text import collapse_whitespace
+
+# Client errors that may succeed on retry; other 4xx responses are returned as failures immediately
+RETRYABLE_CLIENT_ERRORS = {408, 429}
+
+# Month lookups (case-insensitive, like strptime) for the fixed date formats the sites use
+MONTH_ABBREVIATIONS = {month.lower(): number for number, month in enumerate(
+    ('Jan', 'Feb', 'Mar', 'Apr', 'May', 'Jun', 'Jul', 'Aug', 'Sep', 'Oct', 'Nov', 'Dec'), start=1
+)}
+MONTH_NAMES = {month.lower(): number for number, month in enumerate(
+    ('January', 'February', 'March', 'April', 'May', 'June',
+     'July', 'August', 'September', 'October', 'November', 'December'), start=1
+)}
+# strptime formats that can be parsed by splitting on a separator: format -> (separator, month lookup)
+FAST_DATE_FORMATS = {
+    '%d-%b-%Y': ('-', MONTH_ABBREVIATIONS),  # e.g. 26-Jun-2025 (CAS)
+    '%d %B %Y': (' ', MONTH_NAMES),  # e.g. 30 June 2025 (GOV.UK)
+}
+UNSAFE_FILENAME_PATTERN = re.compile(r'[^A-Za-z0-9._-]')
+
+
+class TokenBucket:
+    """Thread-safe token bucket: bursts of up to `capacity` requests, refilled at `rate` tokens per second"""
+
+    def __init__(self, capacity: int, rate: float):
+        self.capacity = max(1, capacity)  # Below one token, acquire() could never succeed
+        self.rate = rate
+        self._tokens = float(self.capacity)
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def acquire(self):
+        """Take a token, sleeping (without holding the lock) until one is available"""
+        if self.rate <= 0:
+            return
+
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+                self._updated = now
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return
+                wait = (1 - self._tokens) / self.rate
+            time.sleep(wait)
 
 
 class BaseScraper(ABC):
     """Abstract base class for scrapers"""
 
+    # BeautifulSoup tree builder used for every page; lxml is the fastest bs4 backend
+    HTML_PARSER = 'lxml'
+
     def __init__(self):
-        self.session = requests.Session()
+        # Persistent HTTP cache; requests opt in per call (detail pages in fetch_soup, conditional
+        # list-page GETs in handle_request_errors), so the CAS postbacks are never cached
+        self.session = requests_cache.CachedSession(
+            cache_name=str(settings.BACKUP_DIR / 'http_cache'),
+            backend='sqlite',
+            expire_after=requests_cache.DO_NOT_CACHE
+        )
         self.session.headers.update({
             'User-Agent': settings.USER_AGENT
         })
+        # Keep a kept-alive connection for every concurrent detail-page fetch plus the
+        # pagination thread, so none is closed and re-handshaked when returned to a full pool
+        adapter = HTTPAdapter(pool_connections=settings.ENRICH_CONCURRENCY, pool_maxsize=settings.ENRICH_CONCURRENCY + 1)
+        self.session.mount('https://', adapter)
+        self.session.mount('http://', adapter)
         self.alerts: List[Alert] = []
+        self._enrich_executor: Optional[ThreadPoolExecutor] = None
+        self._backup_executor: Optional[ThreadPoolExecutor] = None
+        self._interned: Dict[str, str] = {}
+        # Shared by the pagination thread and the enrichment workers, so the site sees one overall rate
+        self._rate_limiter = TokenBucket(settings.RATE_LIMIT_BURST, settings.RATE_LIMIT_PER_SECOND)
 
-    def handle_request_errors(self, url: str, retries: int = 0) -> Optional[requests.Response]:
+    def handle_request_errors(self, url: str) -> Optional[requests.Response]:
         """Handle HTTP requests with error handling and retries"""
+        for attempt in range(settings.MAX_RETRIES + 1):
+            retry_after = None
+            self.rate_limit()
+            try:
+                # List pages are stored but always revalidated: the cache sends If-None-Match /
+                # If-Modified-Since from the last response, and a 304 replays the stored body
+                response = self.session.get(
+                    url,
+                    timeout=settings.TIMEOUT_SECONDS,
+                    expire_after=requests_cache.EXPIRE_IMMEDIATELY
+                )
+                response.raise_for_status()
+                if response.from_cache:
+                    logger.debug(f"Not modified since last run: {url}")
+                return response
+            except requests.exceptions.HTTPError as e:
+                logger.error(f"Request failed for {url}: {e}")
+                status_code = e.response.status_code if e.response is not None else None
+                if status_code and 400 <= status_code < 500 and status_code not in RETRYABLE_CLIENT_ERRORS:
+                    return None  # Retrying won't fix a dead URL or a bad request
+                retry_after = self.get_retry_after(e.response)
+            except requests.exceptions.RequestException as e:
+                logger.error(f"Request failed for {url}: {e}")
+
+            if attempt < settings.MAX_RETRIES:
+                if retry_after is None:
+                    # Capped exponential backoff with jitter so retries don't synchronise
+                    retry_after = min(settings.MAX_BACKOFF_SECONDS, 2 ** attempt) * (1 + random.random() * 0.5)
+                logger.info(f"Retrying in {retry_after:.1f}s... ({attempt + 1}/{settings.MAX_RETRIES})")
+                time.sleep(retry_after)
+
+        return None
+
+    def get_retry_after(self, response: Optional[requests.Response]) -> Optional[float]:
+        """Seconds to wait from a Retry-After header (delta-seconds or HTTP date), if present"""
+        value = response.headers.get('Retry-After') if response is not None else None
+        if not value:
+            return None
+
         try:
-            response = self.session.get(
-                url,
-                timeout=settings.TIMEOUT_SECONDS
-            )
-            response.raise_for_status()
-            return response
-        except requests.exceptions.RequestException as e:
-            logger.error(f"Request failed for {url}: {e}")
-            if retries < settings.MAX_RETRIES:
-                logger.info(f"Retrying... ({retries + 1}/{settings.MAX_RETRIES})")
-                time.sleep(2 ** retries)  # Exponential backoff
-                return self.handle_request_errors(url, retries + 1)
+            return max(0.0, float(value))
+        except ValueError:
+            pass
+
+        try:
+            retry_at = parsedate_to_datetime(value)
+            if retry_at.tzinfo is None:
+                retry_at = retry_at.replace(tzinfo=timezone.utc)
+            return max(0.0, (retry_at - datetime.now(timezone.utc)).total_seconds())
+        except (TypeError, ValueError):
             return None
 
     def parse_date(self, date_str: str, formats: List[str]) -> Optional[datetime]:
@@ -49,6 +159,12 @@ class BaseScraper(ABC):
         date_str = date_str.strip()
 
         for fmt in formats:
+            # Fixed day/month/year formats skip strptime's format parsing and locale lookups
+            if fmt in FAST_DATE_FORMATS:
+                parsed = self.parse_day_month_year(date_str, *FAST_DATE_FORMATS[fmt])
+                if parsed:
+                    return parsed
+
             try:
                 return datetime.strptime(date_str, fmt)
             except ValueError:
@@ -57,46 +173,123 @@ class BaseScraper(ABC):
         logger.warning(f"Could not parse date: {date_str}")
         return None
 
+    def parse_day_month_year(self, date_str: str, separator: str, months: Dict[str, int]) -> Optional[datetime]:
+        """Parse a '<day><sep><month><sep><year>' date via a month lookup; None if it doesn't fit the shape"""
+        parts = date_str.split(separator)
+        if len(parts) != 3:
+            return None
+
+        day, month, year = parts
+        month_number = months.get(month.lower())
+        if not month_number or not (day.isdigit() and len(day) <= 2 and year.isdigit() and len(year) == 4):
+            return None
+
+        try:
+            return datetime(int(year), month_number, int(day))
+        except ValueError:
+            return None  # e.g. 31-Feb; let strptime report it
+
     def clean_text(self, text: str) -> str:
         """Clean and normalize text content"""
         if not text:
             return ""
 
-        # Remove extra whitespace and normalize
-        text = ' '.join(text.split())
-        return text.strip()
+        return collapse_whitespace(text)
+
+    def intern_text(self, text: str) -> str:
+        """Return a shared instance of a value repeated across many alerts (originator, status, type...)"""
+        return self._interned.setdefault(text, text)
 
     def rate_limit(self):
-        """Apply rate limiting between requests"""
-        time.sleep(settings.SCRAPE_DELAY_SECONDS)
+        """Wait for the rate limiter before sending a request"""
+        self._rate_limiter.acquire()
 
     def save_raw_data(self, data: str, filename: str):
-        """Save raw HTML data for debugging"""
+        """Save raw HTML data for debugging; the write happens on a background thread"""
         if settings.BACKUP_ENABLED:
-            import re
             # Replace invalid filename characters with underscores
-            safe_filename = re.sub(r'[^A-Za-z0-9._-]', '_', filename)
+            safe_filename = UNSAFE_FILENAME_PATTERN.sub('_', filename)
             filepath = settings.BACKUP_DIR / f"{safe_filename}_{datetime.now().strftime('%Y%m%d_%H%M%S')}.html"
-            with open(filepath, 'w', encoding='utf-8') as f:
-                f.write(data)
+
+            # A single writer thread keeps disk I/O off the scraping path and writes in queue order
+            if self._backup_executor is None:
+                self._backup_executor = ThreadPoolExecutor(
+                    max_workers=1,
+                    thread_name_prefix=f"{type(self).__name__}-backup"
+                )
+            self._backup_executor.submit(self._write_raw_data, filepath, data)
+
+    def _write_raw_data(self, filepath, data: str):
+        """Write raw HTML to disk as UTF-8 bytes"""
+        try:
+            with open(filepath, 'wb') as f:
+                f.write(data.encode('utf-8', 'replace'))
             logger.debug(f"Raw data saved to {filepath}")
+        except OSError as e:
+            logger.error(f"Failed to save raw data to {filepath}: {e}")
+
+    def flush_raw_data(self):
+        """Block until every queued raw-data write has finished"""
+        if self._backup_executor is None:
+            return
+
+        self._backup_executor.shutdown(wait=True)
+        self._backup_executor = None
 
     @abstractmethod
     def scrape(self) -> List[Alert]:
         """Abstract method to be implemented by subclasses"""
         pass
 
-    def get_soup(self, response: requests.Response) -> BeautifulSoup:
-        """Create BeautifulSoup object from response"""
-        return BeautifulSoup(response.content, 'html.parser')
+    @abstractmethod
+    def enrich_alert_with_detail(self, alert: Alert):
+        """Fetch the alert detail page and update the Alert with extra fields"""
+        pass
 
-    def extract_alert_url(self, base_url: str, relative_url: str) -> str:
-        """Construct full URL from base and relative URLs"""
-        if relative_url.startswith('http'):
-            return relative_url
+    def enrich_alerts(self, alerts: List[Alert]):
+        """
+        Queue alerts for detail-page enrichment on a shared worker pool.
+        Returns immediately so the next list page can be fetched while detail
+        pages download; call wait_for_enrichment() before using the alerts.
+        """
+        if self._enrich_executor is None:
+            self._enrich_executor = ThreadPoolExecutor(
+                max_workers=settings.ENRICH_CONCURRENCY,
+                thread_name_prefix=f"{type(self).__name__}-enrich"
+            )
+
+        # Detail fetches are network-bound and independent; the pooled session is shared
+        for alert in alerts:
+            if alert.url:
+                self._enrich_executor.submit(self.enrich_alert_with_detail, alert)
 
-        if relative_url.startswith('/'):
-            from urllib.parse import urljoin
-            return urljoin(base_url, relative_url)
+    def wait_for_enrichment(self):
+        """Block until every queued detail-page fetch has finished"""
+        if self._enrich_executor is None:
+            return
 
-        return f"{base_url.rstrip('/')}/{relative_url.lstrip('/')}"
+        self._enrich_executor.shutdown(wait=True)
+        self._enrich_executor = None
+
+    def get_soup(self, response: requests.Response, parse_only: Optional[SoupStrainer] = None) -> BeautifulSoup:
+        """Create BeautifulSoup object from response, optionally parsing only the parts matched by a strainer"""
+        return BeautifulSoup(response.content, self.HTML_PARSER, parse_only=parse_only)
+
+    def fetch_soup(self, url: str, parse_only: Optional[SoupStrainer] = None) -> BeautifulSoup:
+        """
+        Fetch a page and parse it.
+        Responses are kept in the on-disk HTTP cache for DETAIL_CACHE_DAYS, so unchanged
+        alerts are re-parsed from disk instead of re-downloaded on later runs.
+        """
+        expire_after = (
+            timedelta(days=settings.DETAIL_CACHE_DAYS) if settings.DETAIL_CACHE_DAYS > 0
+            else requests_cache.DO_NOT_CACHE
+        )
+        self.rate_limit()
+        response = self.session.get(url, timeout=settings.TIMEOUT_SECONDS, expire_after=expire_after)
+        response.raise_for_status()
+        return BeautifulSoup(response.content, self.HTML_PARSER, parse_only=parse_only)
+
+    def extract_alert_url(self, base_url: str, relative_url: str) -> str:
+        """Construct full URL from base and relative URLs"""
+        return urljoin(base_url, relative_url)
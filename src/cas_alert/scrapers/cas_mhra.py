@@ -1,11 +1,12 @@
 """
 Scraper for the CAS MHRA website
 """
-import time
+import re
 import requests
+import soupsieve as sv
 from typing import List, Optional
 from datetime import datetime
-from bs4 import BeautifulSoup, Tag
+from bs4 import BeautifulSoup, SoupStrainer
 from loguru import logger
 from urllib.parse import urljoin
 
@@ -13,6 +14,37 @@ from .base import BaseScraper
 from ..config import settings
 from ..data.models import Alert
 
+ALERT_TABLE_ID = 'ctl00_ContentPlaceHolder1_AlertSearchResults1_gvwAlertList'
+
+# List pages only need the alert table (which also holds the pager) and the
+# ASP.NET state fields, so parse just those elements
+LIST_PAGE_STRAINER = SoupStrainer(id=[ALERT_TABLE_ID, '__VIEWSTATE', '__EVENTVALIDATION'])
+
+# Selectors and patterns are compiled once rather than on every page/row
+ALERT_TABLE_SELECTOR = sv.compile(f'#{ALERT_TABLE_ID}')
+ALERT_ROW_SELECTOR = sv.compile(':scope > tr, :scope > tbody > tr')  # Not the pager's nested table rows
+PAGINATION_LINK_SELECTOR = sv.compile(f'#{ALERT_TABLE_ID} a[href*="Page$"]')
+CURRENT_PAGE_SELECTOR = sv.compile('.gridview_pager span')
+VIEWSTATE_SELECTOR = sv.compile('input[name="__VIEWSTATE"]')
+EVENTVALIDATION_SELECTOR = sv.compile('input[name="__EVENTVALIDATION"]')
+PAGE_ARGUMENT_PATTERN = re.compile(r"Page\$(\d+)")  # __doPostBack(..., 'Page$2')
+ISSUE_DATE_PATTERN = re.compile(r'^\d{2}-[A-Za-z]{3}-\d{4}$')  # e.g. 26-Jun-2025
+
+# Labels on the alert detail page; each value is in the element after the label's element
+DETAIL_LABELS = (
+    "Originator:",
+    "Action category:",
+    "Broadcast content:",
+    "Additional information:",
+    "Action underway deadline:",
+    "Action complete deadline:",
+    "Attachments:",
+)
+# Elements whose own text contains any of the labels, matched by soupsieve
+DETAIL_LABEL_SELECTOR = sv.compile(
+    ':-soup-contains-own({})'.format(', '.join(f'"{label}"' for label in DETAIL_LABELS))
+)
+
 
 class CASMHRAScraper(BaseScraper):
     """Scraper for the CAS MHRA website"""
@@ -31,10 +63,10 @@ class CASMHRAScraper(BaseScraper):
             return None
 
         self.save_raw_data(response.text, "cas_mhra_initial")
-        soup = self.get_soup(response)
+        soup = self.get_soup(response, parse_only=LIST_PAGE_STRAINER)
 
-        viewstate_element = soup.select_one('input[name="__VIEWSTATE"]')
-        eventvalidation_element = soup.select_one('input[name="__EVENTVALIDATION"]')
+        viewstate_element = VIEWSTATE_SELECTOR.select_one(soup)
+        eventvalidation_element = EVENTVALIDATION_SELECTOR.select_one(soup)
 
         if viewstate_element and 'value' in viewstate_element.attrs:
             self.viewstate = viewstate_element['value']
@@ -73,6 +105,7 @@ class CASMHRAScraper(BaseScraper):
         logger.info(f"Fetching page with postback: EVENTTARGET={eventtarget}, EVENTARGUMENT={eventargument}")
 
         try:
+            self.rate_limit()
             response = self.session.post(
                 self.base_url,
                 data=payload,
@@ -80,11 +113,11 @@ class CASMHRAScraper(BaseScraper):
             )
             response.raise_for_status()
             self.save_raw_data(response.text, f"cas_mhra_page_{eventargument or 'initial'}")
-            soup = self.get_soup(response)
+            soup = self.get_soup(response, parse_only=LIST_PAGE_STRAINER)
 
             # Update ViewState and EventValidation for subsequent requests
-            new_viewstate = soup.select_one('input[name="__VIEWSTATE"]')
-            new_eventvalidation = soup.select_one('input[name="__EVENTVALIDATION"]')
+            new_viewstate = VIEWSTATE_SELECTOR.select_one(soup)
+            new_eventvalidation = EVENTVALIDATION_SELECTOR.select_one(soup)
 
             if new_viewstate:
                 self.viewstate = new_viewstate['value']
@@ -101,29 +134,31 @@ class CASMHRAScraper(BaseScraper):
         """Parse the alert table from the BeautifulSoup object"""
         alerts: List[Alert] = []
 
-        table = soup.select_one('#ctl00_ContentPlaceHolder1_AlertSearchResults1_gvwAlertList')
+        table = ALERT_TABLE_SELECTOR.select_one(soup)
         if not table:
             logger.warning("Alert table not found on the page.")
             return alerts
 
-        rows = table.select('tr')[1:] # Skip header row
+        rows = ALERT_ROW_SELECTOR.select(table)[1:] # Skip header row
 
         for row in rows:
-            cols = row.select('td')
+            # Direct cells only, so the nested font/span/anchor markup isn't searched
+            cols = row.find_all('td', recursive=False)
             if len(cols) >= 5: # Ensure enough columns exist
                 try:
-                    reference = self.clean_text(cols[0].get_text())
-                    title_element = cols[1].select_one('a')
-                    title = self.clean_text(title_element.get_text()) if title_element else self.clean_text(cols[1].get_text())
+                    reference, originator, issue_date_str, status = (
+                        self.clean_text(cols[i].get_text()) for i in (0, 2, 3, 4)
+                    )
+                    originator = self.intern_text(originator)
+                    status = self.intern_text(status)
+
+                    # Find the title anchor once; it supplies both the title text and the URL
+                    title_element = cols[1].find('a')
+                    title = self.clean_text((title_element or cols[1]).get_text())
                     alert_url = self.extract_alert_url(self.base_url, str(title_element['href'])) if title_element and 'href' in title_element.attrs else ''
-                    originator = self.clean_text(cols[2].get_text())
-                    issue_date_str = self.clean_text(cols[3].get_text())
-                    status = self.clean_text(cols[4].get_text())
 
                     # Only attempt to parse if the date string matches the expected format (e.g., 26-Jun-2025)
-                    import re
-                    date_pattern = re.compile(r'^\d{2}-[A-Za-z]{3}-\d{4}$')
-                    if date_pattern.match(issue_date_str):
+                    if ISSUE_DATE_PATTERN.match(issue_date_str):
                         issue_date = self.parse_date(issue_date_str, ['%d-%b-%Y']) # e.g., 26-Jun-2025
                     else:
                         issue_date = None
@@ -147,9 +182,6 @@ class CASMHRAScraper(BaseScraper):
                             source='CAS',
                             url=alert_url
                         )
-                        # Enrich alert with detail page data
-                        if alert_url:
-                            self.enrich_alert_with_detail(alert)
                         alerts.append(alert)
                         logger.debug(f"Parsed alert: {alert.reference} - {alert.title}")
                     else:
@@ -159,23 +191,22 @@ class CASMHRAScraper(BaseScraper):
                     logger.error(f"Error parsing row: {row.get_text()}. Error: {e}")
                     continue
 
+        # Enrich alerts with detail page data (in the background)
+        self.enrich_alerts(alerts)
+
         return alerts
 
     def enrich_alert_with_detail(self, alert: Alert):
         """Fetch and parse the alert detail page, updating the Alert object with extra fields."""
         try:
-            response = self.session.get(alert.url, timeout=settings.TIMEOUT_SECONDS)
-            response.raise_for_status()
-            soup = BeautifulSoup(response.content, 'html.parser')
+            soup = self.fetch_soup(alert.url)
 
             # Example selectors - these may need adjustment based on actual page structure
-            def get_text_by_label(label):
-                el = soup.find(string=lambda t: isinstance(t, str) and label in t)
-                if el and hasattr(el, "parent") and isinstance(el.parent, Tag):
-                    sibling = el.parent.find_next_sibling()
-                    if sibling and isinstance(sibling, Tag):
-                        return sibling.get_text(strip=True)
-                return ""
+            sections = self.find_label_sections(soup)
+
+            def get_text_by_label(label, separator=""):
+                section = sections.get(label)
+                return section.get_text(separator=separator, strip=True) if section else ""
 
             # Originator (may already be set, but can be updated if more detail is present)
             originator = get_text_by_label("Originator:")
@@ -186,14 +217,7 @@ class CASMHRAScraper(BaseScraper):
             alert.action_category = get_text_by_label("Action category:")
 
             # Broadcast content
-            broadcast_content = ""
-            bc_label = soup.find(string=lambda t: isinstance(t, str) and "Broadcast content:" in t)
-            if bc_label and hasattr(bc_label, "parent") and isinstance(bc_label.parent, Tag):
-                bc_parent = bc_label.parent
-                bc_content = bc_parent.find_next_sibling()
-                if bc_content and isinstance(bc_content, Tag):
-                    broadcast_content = bc_content.get_text(separator="\n", strip=True)
-            alert.broadcast_content = broadcast_content
+            alert.broadcast_content = get_text_by_label("Broadcast content:", separator="\n")
 
             # Additional information
             alert.additional_info = get_text_by_label("Additional information:")
@@ -204,21 +228,33 @@ class CASMHRAScraper(BaseScraper):
 
             # Attachments (collect all links in the attachments section)
             attachments = []
-            attach_label = soup.find(string=lambda t: isinstance(t, str) and "Attachments:" in t)
-            if attach_label and hasattr(attach_label, "parent") and isinstance(attach_label.parent, Tag):
-                attach_parent = attach_label.parent
-                attach_section = attach_parent.find_next_sibling()
-                if attach_section and isinstance(attach_section, Tag):
-                    for a in attach_section.find_all("a", href=True):
-                        if isinstance(a, Tag):
-                            href = a.get("href", "")
-                            text = a.get_text(strip=True)
-                            attachments.append(f"{text} ({href})")
+            attach_section = sections.get("Attachments:")
+            if attach_section:
+                for a in attach_section.find_all("a", href=True):
+                    href = a.get("href", "")
+                    text = a.get_text(strip=True)
+                    attachments.append(f"{text} ({href})")
             alert.attachments = ", ".join(attachments) if attachments else ""
 
         except Exception as e:
             logger.warning(f"Failed to enrich alert from detail page {alert.url}: {e}")
 
+    def find_label_sections(self, soup: BeautifulSoup) -> dict:
+        """
+        Map each detail label to the element following the first element whose own text contains it.
+        A single soupsieve pass finds all label elements instead of a Python callback per text node.
+        """
+        sections = {}
+        for element in DETAIL_LABEL_SELECTOR.iselect(soup):
+            own_text = "".join(element.find_all(string=True, recursive=False))
+            for label in DETAIL_LABELS:
+                if label not in sections and label in own_text:
+                    sections[label] = element.find_next_sibling()
+            if len(sections) == len(DETAIL_LABELS):
+                break
+
+        return sections
+
     def scrape(self) -> List[Alert]:
         """Scrape all pages of alerts from the CAS MHRA website"""
         self.alerts = []
@@ -230,26 +266,20 @@ class CASMHRAScraper(BaseScraper):
             return []
 
         self.alerts.extend(self.parse_alert_table(soup))
-        self.rate_limit()
 
         # Find pagination links
-        pagination_links = soup.select('#ctl00_ContentPlaceHolder1_AlertSearchResults1_gvwAlertList a')
+        pagination_links = PAGINATION_LINK_SELECTOR.select(soup)
 
-        # Extract page numbers from links and sort them
-        page_numbers = []
-        current_page_span = soup.select_one('.gridview_pager span')
+        # Extract page numbers from the postback arguments in the link hrefs and sort them
+        current_page_span = CURRENT_PAGE_SELECTOR.select_one(soup)
         current_page_text = current_page_span.get_text() if current_page_span else None
+        current_page = int(current_page_text) if current_page_text and current_page_text.isdigit() else None
 
-        for link in pagination_links:
-            try:
-                link_text = link.get_text()
-                # Check if the link text is a digit and not the current page
-                if link_text.isdigit() and link_text != current_page_text:
-                     page_numbers.append(int(link_text))
-            except ValueError:
-                continue # Ignore non-numeric links (like '...')
-
-        page_numbers = sorted(list(set(page_numbers))) # Get unique sorted page numbers
+        page_numbers = sorted({
+            int(match.group(1))
+            for link in pagination_links
+            if (match := PAGE_ARGUMENT_PATTERN.search(link.get('href', '')))
+        } - {current_page})
 
         logger.info(f"Found pagination links for pages: {page_numbers}")
 
@@ -263,10 +293,13 @@ class CASMHRAScraper(BaseScraper):
             soup = self.get_page_with_postback(eventtarget=eventtarget, eventargument=eventargument)
             if soup:
                 self.alerts.extend(self.parse_alert_table(soup))
-                self.rate_limit()
             else:
                 logger.warning(f"Failed to fetch page {page_num}. Stopping pagination.")
                 break # Stop if a page fails to load
 
+        # Detail pages were fetched and raw pages written in the background while paginating
+        self.wait_for_enrichment()
+        self.flush_raw_data()
+
         logger.info(f"Finished scraping CAS MHRA. Total alerts found: {len(self.alerts)}")
         return self.alerts
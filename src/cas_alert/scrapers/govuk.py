@@ -1,10 +1,11 @@
 """
 Scraper for the GOV.UK Drug/Device Alerts website
 """
-import time
+import re
+import soupsieve as sv
 from typing import List, Optional
 from datetime import datetime
-from bs4 import BeautifulSoup, Tag
+from bs4 import BeautifulSoup, SoupStrainer, Tag
 from loguru import logger
 from urllib.parse import urljoin
 
@@ -12,6 +13,17 @@ from .base import BaseScraper
 from ..config import settings
 from ..data.models import Alert
 
+# List pages only need the document list items and the pagination <nav>,
+# so skip building the rest of the page (head, scripts, header, footer...)
+LIST_PAGE_STRAINER = SoupStrainer(['li', 'nav'])
+
+# Selectors are compiled once rather than on every page/item
+ALERT_ITEM_SELECTOR = sv.compile('.gem-c-document-list__item')
+ALERT_TITLE_LINK_SELECTOR = sv.compile('.gem-c-document-list__item-title a')
+ALERT_METADATA_SELECTOR = sv.compile('.gem-c-document-list__item-metadata dd')
+NEXT_PAGE_LINK_SELECTOR = sv.compile('.pagination__next a')
+DMRC_REFERENCE_PATTERN = re.compile(r"DMRC[-\s:]?\d+")  # e.g. DMRC-12345
+
 
 class GOVUKScraper(BaseScraper):
     """Scraper for the GOV.UK Drug/Device Alerts website"""
@@ -28,13 +40,13 @@ class GOVUKScraper(BaseScraper):
             return None
 
         self.save_raw_data(response.text, f"govuk_list_{page_url.split('=')[-1]}")
-        return self.get_soup(response)
+        return self.get_soup(response, parse_only=LIST_PAGE_STRAINER)
 
     def parse_alert_list(self, soup: BeautifulSoup) -> List[Alert]:
         """Parse the list of alerts on a page"""
         alerts: List[Alert] = []
 
-        alert_items = soup.select('.gem-c-document-list__item')
+        alert_items = ALERT_ITEM_SELECTOR.select(soup)
 
         if not alert_items:
             logger.warning("No alert items found on the GOV.UK page.")
@@ -42,15 +54,15 @@ class GOVUKScraper(BaseScraper):
 
         for item in alert_items:
             try:
-                title_element = item.select_one('.gem-c-document-list__item-title a')
+                title_element = ALERT_TITLE_LINK_SELECTOR.select_one(item)
                 title = self.clean_text(title_element.get_text()) if title_element else ""
                 alert_url = self.extract_alert_url(self.base_url, str(title_element['href'])) if title_element and 'href' in title_element.attrs else ''
 
-                metadata_elements = item.select('.gem-c-document-list__item-metadata dd')
+                metadata_elements = ALERT_METADATA_SELECTOR.select(item)
 
-                alert_type = self.clean_text(metadata_elements[0].get_text()) if len(metadata_elements) > 0 else "Unknown"
+                alert_type = self.intern_text(self.clean_text(metadata_elements[0].get_text())) if len(metadata_elements) > 0 else "Unknown"
                 # Medical specialty is often the second dd, but can be missing
-                medical_specialty = self.clean_text(metadata_elements[1].get_text()) if len(metadata_elements) > 1 else None
+                medical_specialty = self.intern_text(self.clean_text(metadata_elements[1].get_text())) if len(metadata_elements) > 1 else None
                 issue_date_str = self.clean_text(metadata_elements[-1].get_text()) if len(metadata_elements) > 0 else "" # Issue date is usually the last dd
 
                 issue_date = self.parse_date(issue_date_str, ['%d %B %Y']) # e.g., 30 June 2025
@@ -74,9 +86,6 @@ class GOVUKScraper(BaseScraper):
                         url=alert_url,
                         medical_specialty=medical_specialty
                     )
-                    # Enrich alert with detail page data
-                    if alert_url:
-                        self.enrich_alert_with_detail(alert)
                     alerts.append(alert)
                     logger.debug(f"Parsed GOV.UK alert: {alert.title}")
                 else:
@@ -86,18 +95,18 @@ class GOVUKScraper(BaseScraper):
                 logger.error(f"Error parsing GOV.UK alert item: {item.get_text()}. Error: {e}")
                 continue
 
+        # Enrich alerts with detail page data (in the background)
+        self.enrich_alerts(alerts)
+
         return alerts
 
     def enrich_alert_with_detail(self, alert: Alert):
         """Fetch and parse the alert detail page, updating the Alert object with extra fields."""
         try:
-            import re
-            response = self.session.get(alert.url, timeout=settings.TIMEOUT_SECONDS)
-            response.raise_for_status()
-            soup = BeautifulSoup(response.content, 'html.parser')
+            soup = self.fetch_soup(alert.url)
 
             # Title (may be more detailed on the page)
-            page_title = soup.select_one("h1")
+            page_title = soup.find("h1")
             if page_title:
                 alert.title = page_title.get_text(strip=True)
 
@@ -112,17 +121,23 @@ class GOVUKScraper(BaseScraper):
                     pass
 
             # Extract reference number (e.g., DMRC reference number, batch, etc.)
-            # Try to find a reference number in the content
-            content_text = soup.get_text(separator="\n", strip=True)
-            ref_match = re.search(r"(DMRC[-\s:]?\d+)", content_text)
-            if ref_match:
-                alert.reference = ref_match.group(1)
+            # Search text nodes directly rather than joining the whole page into one string
+            ref_node = soup.find(string=DMRC_REFERENCE_PATTERN)
+            if ref_node:
+                alert.reference = DMRC_REFERENCE_PATTERN.search(ref_node).group(0)
 
             # Try to extract batch numbers, background, advice, etc.
             # This is heuristic and may need adjustment for different alert types
+            # Collect the h2/h3 section headers and their text in one pass
+            headers = [
+                (tag, tag.get_text(strip=True).lower())
+                for tag in soup.find_all(["h2", "h3"])
+            ]
+
             def extract_section(label):
                 # Find the section header, then get the next sibling or following text
-                header = soup.find(lambda tag: isinstance(tag, Tag) and tag.name in ["h2", "h3"] and label.lower() in tag.get_text(strip=True).lower())
+                label = label.lower()
+                header = next((tag for tag, text in headers if label in text), None)
                 if header:
                     # Try to get all text until the next header of the same level
                     texts = []
@@ -134,7 +149,8 @@ class GOVUKScraper(BaseScraper):
                     return "\n".join(texts).strip()
                 return ""
 
-            alert.additional_info = extract_section("Additional information") or extract_section("Additional Information")
+            # Matching is case-insensitive, so one lookup covers "Additional Information" too
+            alert.additional_info = extract_section("Additional information")
             alert.broadcast_content = extract_section("Background")
             alert.action_category = extract_section("Advice for Healthcare Professionals")
             # Attachments (look for download links)
@@ -152,7 +168,7 @@ class GOVUKScraper(BaseScraper):
 
     def get_next_page_url(self, soup: BeautifulSoup) -> Optional[str]:
         """Find the URL for the next page in pagination"""
-        next_link = soup.select_one('.pagination__next a')
+        next_link = NEXT_PAGE_LINK_SELECTOR.select_one(soup)
         if next_link and 'href' in next_link.attrs:
             next_page_relative_url = str(next_link['href'])
             return self.extract_alert_url(self.base_url, next_page_relative_url)
@@ -168,11 +184,13 @@ class GOVUKScraper(BaseScraper):
             if soup:
                 self.alerts.extend(self.parse_alert_list(soup))
                 current_url = self.get_next_page_url(soup)
-                if current_url:
-                    self.rate_limit() # Rate limit before fetching the next page
             else:
                 logger.error(f"Failed to fetch GOV.UK page: {current_url}. Stopping pagination.")
                 break # Stop if a page fails to load
 
+        # Detail pages were fetched and raw pages written in the background while paginating
+        self.wait_for_enrichment()
+        self.flush_raw_data()
+
         logger.info(f"Finished scraping GOV.UK. Total alerts found: {len(self.alerts)}")
         return self.alerts
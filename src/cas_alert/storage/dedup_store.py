@@ -0,0 +1,93 @@
+"""
+Local SQLite index of the alert keys already written to Google Sheets
+"""
+import sqlite3
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Set, Tuple
+
+from loguru import logger
+
+HASH_ID = 'hash_id'
+REFERENCE = 'reference'
+
+
+class DedupStore:
+    """
+    Append-only store of the hash IDs and references written to one worksheet.
+    Lets duplicate checks run against a local B-tree index instead of re-reading the sheet.
+    """
+
+    def __init__(self, db_path: Path, scope: str):
+        self.scope = scope  # e.g. '<sheet id>/<worksheet name>', so one database can serve several worksheets
+        self.connection = sqlite3.connect(db_path)
+        with self.connection:
+            # The primary key is the lookup index; WITHOUT ROWID stores rows in that B-tree directly
+            self.connection.execute(
+                "CREATE TABLE IF NOT EXISTS dedup_keys ("
+                "scope TEXT NOT NULL, kind TEXT NOT NULL, value TEXT NOT NULL, "
+                "PRIMARY KEY (scope, kind, value)) WITHOUT ROWID"
+            )
+            # MinHash signatures for near-duplicate detection, by hash ID
+            self.connection.execute(
+                "CREATE TABLE IF NOT EXISTS minhash_signatures ("
+                "scope TEXT NOT NULL, hash_id TEXT NOT NULL, signature BLOB NOT NULL, "
+                "PRIMARY KEY (scope, hash_id)) WITHOUT ROWID"
+            )
+
+    def is_empty(self) -> bool:
+        """True until the store has been backfilled for this scope"""
+        row = self.connection.execute(
+            "SELECT EXISTS (SELECT 1 FROM dedup_keys WHERE scope = ?)", (self.scope,)
+        ).fetchone()
+        return not row[0]
+
+    def load(self) -> Tuple[Set[str], Set[str]]:
+        """Return the stored (hash IDs, references)"""
+        keys = {HASH_ID: set(), REFERENCE: set()}
+        for kind, value in self.connection.execute(
+            "SELECT kind, value FROM dedup_keys WHERE scope = ?", (self.scope,)
+        ):
+            keys[kind].add(value)
+        return keys[HASH_ID], keys[REFERENCE]
+
+    def load_signatures(self) -> Dict[str, bytes]:
+        """Return the stored MinHash signatures by hash ID"""
+        return dict(self.connection.execute(
+            "SELECT hash_id, signature FROM minhash_signatures WHERE scope = ?", (self.scope,)
+        ))
+
+    def add(self, hash_ids: Iterable[str], references: Iterable[str], signatures: Optional[Dict[str, bytes]] = None):
+        """Record keys (and optionally signatures) written to the sheet; keys already stored are ignored"""
+        rows = self._rows(hash_ids, references)
+        with self.connection:  # One transaction for the whole batch
+            self.connection.executemany("INSERT OR IGNORE INTO dedup_keys VALUES (?, ?, ?)", rows)
+            self._insert_signatures(signatures)
+        logger.debug(f"Recorded {len(rows)} dedup keys in the local store.")
+
+    def replace(self, hash_ids: Iterable[str], references: Iterable[str], signatures: Optional[Dict[str, bytes]] = None):
+        """Resynchronise the store with the sheet's current keys (and signatures), atomically"""
+        rows = self._rows(hash_ids, references)
+        with self.connection:
+            self.connection.execute("DELETE FROM dedup_keys WHERE scope = ?", (self.scope,))
+            self.connection.execute("DELETE FROM minhash_signatures WHERE scope = ?", (self.scope,))
+            self.connection.executemany("INSERT OR IGNORE INTO dedup_keys VALUES (?, ?, ?)", rows)
+            self._insert_signatures(signatures)
+        logger.info(f"Synchronised {len(rows)} dedup keys from Google Sheets into the local store.")
+
+    def _insert_signatures(self, signatures: Optional[Dict[str, bytes]] = None):
+        """Insert signatures inside the caller's transaction"""
+        if signatures:
+            self.connection.executemany(
+                "INSERT OR REPLACE INTO minhash_signatures VALUES (?, ?, ?)",
+                [(self.scope, hash_id, signature) for hash_id, signature in signatures.items()]
+            )
+
+    def _rows(self, hash_ids: Iterable[str], references: Iterable[str]) -> List[Tuple[str, str, str]]:
+        """Rows to insert for the given keys, skipping blanks"""
+        rows = [(self.scope, HASH_ID, value) for value in hash_ids if value]
+        rows += [(self.scope, REFERENCE, value) for value in references if value]
+        return rows
+
+    def close(self):
+        """Close the database connection"""
+        self.connection.close()
@@ -1,16 +1,116 @@
 """
 Google Sheets integration for CAS Alert Scraper
 """
+import functools
+import random
+import time
 import gspread
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta
+from itertools import zip_longest
 import pandas as pd
-from typing import List, Optional
+from typing import Dict, List, Optional, Set, Tuple, Union
 from loguru import logger
 from google.oauth2.service_account import Credentials
 from google.auth.exceptions import DefaultCredentialsError, TransportError
+from gspread.urls import SPREADSHEET_VALUES_APPEND_URL
+from gspread.utils import ValueInputOption, a1_range_to_grid_range, absolute_range_name
+from requests.adapters import HTTPAdapter
+from urllib.parse import quote
 
 from ..config import settings
-from ..data.models import Alert
+from ..data.models import Alert, COLUMNS
+from ..data.duplicates import NearDuplicateIndex
 from ..data.processor import DataProcessor
+from .dedup_store import DedupStore
+
+SCOPES = (
+    'https://www.googleapis.com/auth/spreadsheets',
+    'https://www.googleapis.com/auth/drive'
+)
+# Authorized clients by (credentials path, scopes), shared by every manager in the process.
+# The client's AuthorizedSession refreshes its token itself, so a cached client stays usable.
+_CLIENT_CACHE: Dict[Tuple[str, Tuple[str, ...]], gspread.Client] = {}
+# Opened (spreadsheet, worksheet) handles by (sheet ID, worksheet name), shared the same way
+_HANDLE_CACHE: Dict[Tuple[str, str], Tuple[gspread.Spreadsheet, gspread.Worksheet]] = {}
+
+# How long the existing hash IDs/references read from the sheet are trusted before re-reading
+DEDUP_CACHE_TTL_SECONDS = 300
+# Columns holding the dedup keys (data rows only): 'Reference' is A and 'Hash ID' is K
+REFERENCE_RANGE = 'A2:A'
+HASH_ID_RANGE = 'K2:K'
+# Title, Originator and Issue Date, read only to build the near-duplicate index. Dates come back
+# as serial numbers so they don't depend on the sheet's locale or number format.
+NEAR_DUPLICATE_TEXT_RANGE = 'B2:D'
+NEAR_DUPLICATE_TEXT_PARAMS = {'valueRenderOption': 'UNFORMATTED_VALUE', 'dateTimeRenderOption': 'SERIAL_NUMBER'}
+# Day zero of Sheets date serial numbers
+SHEETS_EPOCH = datetime(1899, 12, 30)
+# Rows per append request, keeping each request well under the Sheets payload limits
+APPEND_CHUNK_ROWS = 500
+# Query parameters for values:append, as Worksheet.append_rows sends them
+APPEND_PARAMS = {'valueInputOption': ValueInputOption.user_entered}
+JSON_HEADERS = {'Content-Type': 'application/json'}
+# Sheets API statuses worth retrying (rate limited / temporarily unavailable)
+RETRYABLE_API_ERRORS = {429, 503}
+
+# Worksheet header row
+HEADERS: Tuple[str, ...] = (
+    'Reference', 'Title', 'Originator', 'Issue Date', 'Status',
+    'Alert Type', 'Source', 'URL', 'Medical Specialty', 'Scraped At', 'Hash ID'
+)
+# Header -> Alert attribute, from the model's column map so the two can't drift apart
+_COLUMN_ATTRS = dict(COLUMNS)
+
+
+# Plain JSON scalars only: USER_ENTERED lets the sheet parse ISO strings into dates,
+# so no pandas dtype detection is needed on the way out
+Cell = Union[str, int, float]
+
+
+def _format_datetime(value) -> str:
+    """ISO 8601 to the second, which USER_ENTERED parses back into a date/time cell"""
+    return value.isoformat(timespec='seconds') if value else ''
+
+
+def _sheet_date_to_iso(value) -> str:
+    """ISO 8601 date of an unformatted date cell: a serial number, or text the sheet didn't parse"""
+    if isinstance(value, (int, float)):
+        return (SHEETS_EPOCH + timedelta(days=value)).date().isoformat()
+    return str(value)
+
+
+def _format_cell(value) -> Cell:
+    """None as an empty cell; everything else is already JSON-safe"""
+    return '' if value is None else value
+
+
+# (attribute, formatter) per sheet column. The datetime columns are known up front,
+# so cells are formatted by column rather than type-checked one by one.
+_HEADER_FIELDS = tuple(
+    (attr, _format_datetime if attr in ('issue_date', 'scraped_at') else _format_cell)
+    for attr in (_COLUMN_ATTRS[header] for header in HEADERS)
+)
+
+
+@functools.lru_cache(maxsize=1)
+def _orjson():
+    """Return the orjson module, or None if it isn't installed (the optional 'fastjson' extra)"""
+    try:
+        import orjson
+    except ImportError:
+        return None
+    return orjson
+
+
+def _append_body(chunk: List[List[Cell]]) -> dict:
+    """
+    Request arguments carrying a values:append body. orjson, when installed, serialises
+    straight to UTF-8 bytes; otherwise requests encodes the body with the stdlib json module.
+    """
+    orjson = _orjson()
+    if orjson:
+        return {'data': orjson.dumps({'values': chunk}), 'headers': JSON_HEADERS}
+    return {'json': {'values': chunk}}
 
 
 class GoogleSheetsManager:
@@ -21,26 +121,39 @@ class GoogleSheetsManager:
         self.sheet: Optional[gspread.Spreadsheet] = None
         self.worksheet: Optional[gspread.Worksheet] = None
         self.processor = DataProcessor() # Use DataProcessor for DataFrame conversion
+        # Dedup keys are scoped by sheet ID and worksheet name, so they can be checked before the sheet is opened
+        self._dedup_scope = f"{settings.GOOGLE_SHEET_ID}/{settings.GOOGLE_WORKSHEET_NAME}"
+        # scope -> (loaded at, existing hash IDs, existing references)
+        self._dedup_cache: Dict[str, Tuple[float, Set[str], Set[str]]] = {}
+        self._dedup_store: Optional[DedupStore] = None  # Opened on first use
+        # Rebuilt whenever the dedup keys are loaded; None if near-duplicate detection is unavailable
+        self._near_duplicates: Optional[NearDuplicateIndex] = None
+        self._append_url: Optional[str] = None  # values:append endpoint for the open worksheet
 
     def authenticate(self):
         """Authenticate with Google Sheets using service account credentials"""
-        # Define the scope
-        scope = [
-            'https://www.googleapis.com/auth/spreadsheets',
-            'https://www.googleapis.com/auth/drive'
-        ]
-
         # Load credentials from the JSON file
         credentials_path = settings.PROJECT_ROOT / settings.GOOGLE_SHEETS_CREDENTIALS_PATH
+        cache_key = (str(credentials_path), SCOPES)
+        cached_client = _CLIENT_CACHE.get(cache_key)
+        if cached_client:
+            self.client = cached_client
+            logger.debug("Reusing authenticated Google Sheets client.")
+            return
+
         try:
             logger.info(f"Attempting to load Google Sheets credentials from: {credentials_path}")
 
             creds = Credentials.from_service_account_file(
-                credentials_path, scopes=scope
+                credentials_path, scopes=list(SCOPES)
             )
 
             # Authorize the client
             self.client = gspread.authorize(creds)
+            # Pooled keep-alive connections for the Sheets and Drive API hosts
+            adapter = HTTPAdapter(pool_connections=4, pool_maxsize=8)
+            self.client.http_client.session.mount('https://', adapter)
+            _CLIENT_CACHE[cache_key] = self.client
             logger.success("Successfully authenticated with Google Sheets.")
 
         except FileNotFoundError:
@@ -58,6 +171,16 @@ class GoogleSheetsManager:
 
     def open_sheet_and_worksheet(self):
         """Open the specified Google Sheet and Worksheet"""
+        if self.sheet and self.worksheet:
+            return
+
+        cache_key = (settings.GOOGLE_SHEET_ID, settings.GOOGLE_WORKSHEET_NAME)
+        cached_handles = _HANDLE_CACHE.get(cache_key)
+        if cached_handles:
+            self.sheet, self.worksheet = cached_handles
+            logger.debug("Reusing opened Google Sheet and Worksheet.")
+            return
+
         if not self.client:
             logger.error("Google Sheets client not authenticated.")
             return
@@ -75,17 +198,15 @@ class GoogleSheetsManager:
                 self.worksheet = self.sheet.add_worksheet(
                     title=settings.GOOGLE_WORKSHEET_NAME,
                     rows=100, # Initial rows, can be expanded
-                    cols=11 # Number of columns based on Alert model
+                    cols=len(HEADERS)
                 )
                 logger.success(f"Created new Worksheet: {self.sheet.title}")
                 # Add headers to the new worksheet
-                headers = [
-                    'Reference', 'Title', 'Originator', 'Issue Date', 'Status',
-                    'Alert Type', 'Source', 'URL', 'Medical Specialty', 'Scraped At', 'Hash ID'
-                ]
-                self.worksheet.append_row(headers)
+                self.worksheet.append_row(list(HEADERS))
                 logger.info("Added headers to the new worksheet.")
 
+            _HANDLE_CACHE[cache_key] = (self.sheet, self.worksheet)
+
         except gspread.SpreadsheetNotFound:
             logger.error(f"Google Sheet with ID '{settings.GOOGLE_SHEET_ID}' not found.")
             raise
@@ -100,12 +221,18 @@ class GoogleSheetsManager:
             return []
 
         try:
-            # Get all records as a list of dictionaries
-            data = self.worksheet.get_all_records()
-            logger.info(f"Retrieved {len(data)} records from Google Sheets.")
-
-            # Convert to DataFrame and then to Alert objects
-            df = pd.DataFrame(data)
+            # Get all values as rows of strings; unlike get_all_records this doesn't
+            # build a dict per row or numericise every cell
+            values = self.worksheet.get_values()
+            if not values:
+                logger.info("Retrieved 0 records from Google Sheets.")
+                return []
+
+            header, *rows = values
+            logger.info(f"Retrieved {len(rows)} records from Google Sheets.")
+
+            # Convert to DataFrame (one allocation for all rows) and then to Alert objects
+            df = pd.DataFrame(rows, columns=header)
             existing_alerts = self.processor.dataframe_to_alerts(df)
             logger.info(f"Converted {len(existing_alerts)} records to Alert objects.")
             return existing_alerts
@@ -114,80 +241,247 @@ class GoogleSheetsManager:
             logger.error(f"Error retrieving data from Google Sheets: {e}")
             return []
 
-    def update_with_new_alerts(self, new_alerts: List[Alert]) -> int:
+    def _fetch_dedup_keys(self, with_text: bool = False) -> Optional[Tuple[Set[str], Set[str], List[Tuple[str, str, str, str]]]]:
         """
-        Update the Google Sheet with new alerts, avoiding duplicates.
-        Returns the number of new alerts added.
+        Read just the Hash ID and Reference columns in one batchGet; None if the read fails.
+        With with_text, also returns (hash ID, title, originator, issue date) rows for the near-duplicate index.
+        """
+        title = self.worksheet.title
+        try:
+            response = self.sheet.values_batch_get(
+                ranges=[absolute_range_name(title, HASH_ID_RANGE), absolute_range_name(title, REFERENCE_RANGE)]
+            )
+            # Empty ranges come back without 'values'; blank cells as empty rows
+            hash_values, reference_values = (
+                value_range.get('values', []) for value_range in response['valueRanges']
+            )
+            existing_hashes = {row[0] for row in hash_values if row and row[0]}
+            existing_references = {row[0] for row in reference_values if row and row[0]}
+            text_rows = []
+            if with_text:
+                # Separate read: the keys stay in their formatted render, the dates need the unformatted one
+                response = self.sheet.values_batch_get(
+                    ranges=[absolute_range_name(title, NEAR_DUPLICATE_TEXT_RANGE)], params=NEAR_DUPLICATE_TEXT_PARAMS
+                )
+                text_values = response['valueRanges'][0].get('values', [])
+                # Trailing blank rows/cells are omitted, so pad both ranges back into line
+                for hash_row, text_row in zip_longest(hash_values, text_values, fillvalue=[]):
+                    if hash_row and hash_row[0]:
+                        alert_title, originator, issue_date = (list(text_row) + ['', '', ''])[:3]
+                        text_rows.append((hash_row[0], str(alert_title), str(originator), _sheet_date_to_iso(issue_date)))
+            logger.info(f"Retrieved {len(existing_hashes)} hash IDs and {len(existing_references)} references from Google Sheets.")
+            return existing_hashes, existing_references, text_rows
+
+        except Exception as e:
+            logger.error(f"Error retrieving hash IDs/references from Google Sheets: {e}")
+            return None
+
+    def _get_local_dedup_sets(self, refresh: bool = False) -> Optional[Tuple[Set[str], Set[str]]]:
+        """
+        Return the hash IDs and references already in the worksheet from memory (kept for
+        DEDUP_CACHE_TTL_SECONDS) or the local dedup store. Returns None when the sheet itself
+        has to be read: the store is still empty, or refresh is set.
         """
+        cached = self._dedup_cache.get(self._dedup_scope)
+        if cached and not refresh and time.monotonic() - cached[0] < DEDUP_CACHE_TTL_SECONDS:
+            logger.debug("Using cached hash IDs/references for duplicate checks.")
+            return cached[1], cached[2]
+
+        if self._dedup_store is None:
+            self._dedup_store = DedupStore(settings.DEDUP_DB_PATH, self._dedup_scope)
+
+        if refresh or self._dedup_store.is_empty():
+            return None
+
+        dedup_keys = self._dedup_store.load()
+        near_duplicates = NearDuplicateIndex.create()
+        if near_duplicates:
+            signatures = self._dedup_store.load_signatures()
+            # Stores filled before near-duplicate detection (or with other MinHash settings) need a resync
+            if (dedup_keys[0] and not signatures) or not near_duplicates.load(signatures):
+                logger.info("Local near-duplicate index is missing or outdated; rebuilding it from Google Sheets.")
+                return None
+        self._near_duplicates = near_duplicates
+        logger.info(f"Loaded {len(dedup_keys[0])} hash IDs and {len(dedup_keys[1])} references from the local dedup store.")
+        self._dedup_cache[self._dedup_scope] = (time.monotonic(), *dedup_keys)
+        return dedup_keys
+
+    def _sync_dedup_sets(self) -> Optional[Tuple[Set[str], Set[str]]]:
+        """Read the dedup keys from the sheet and backfill the local store with them; None if the read fails"""
+        near_duplicates = NearDuplicateIndex.create()
+        fetched = self._fetch_dedup_keys(with_text=near_duplicates is not None)
+        if fetched is None:
+            self._near_duplicates = None
+            return None  # Nothing cached or stored from a failed read
+
+        existing_hashes, existing_references, text_rows = fetched
+        signatures = near_duplicates.build(text_rows) if near_duplicates else None
+        self._near_duplicates = near_duplicates
+        self._dedup_store.replace(existing_hashes, existing_references, signatures)
+        self._dedup_cache[self._dedup_scope] = (time.monotonic(), existing_hashes, existing_references)
+        return existing_hashes, existing_references
+
+    def _ensure_ready(self) -> bool:
+        """Authenticate and open the worksheet if not done yet; True once the worksheet is available"""
         if not self.client:
             self.authenticate()
         if not self.sheet or not self.worksheet:
             self.open_sheet_and_worksheet()
+        return self.worksheet is not None
 
-        if not self.worksheet:
-            logger.error("Google Sheets worksheet is not available for updating.")
+    def update_with_new_alerts(self, new_alerts: List[Alert], refresh: bool = False) -> int:
+        """
+        Update the Google Sheet with new alerts, avoiding duplicates.
+        Pass refresh=True to re-read the existing alerts instead of using the cached dedup keys.
+        Returns the number of new alerts added.
+        """
+        if not new_alerts:
+            logger.info("No new alerts to add to Google Sheets.")
             return 0
 
         logger.info(f"Attempting to update Google Sheets with {len(new_alerts)} new alerts.")
 
-        # Get existing alerts from the sheet
-        existing_alerts = self.get_existing_alerts()
-        existing_hashes = {alert.hash_id for alert in existing_alerts if alert.hash_id}
-        existing_references = {alert.reference for alert in existing_alerts if alert.reference}
-
-        alerts_to_add: List[Alert] = []
-        for alert in new_alerts:
-            # Check for duplicates based on hash ID and reference
-            if alert.hash_id and alert.hash_id in existing_hashes:
-                logger.debug(f"Skipping alert (duplicate hash): {alert.title}")
-                continue
-            if alert.reference and alert.reference in existing_references:
-                 logger.debug(f"Skipping alert (duplicate reference): {alert.reference}")
-                 continue
-
-            # Add to list of alerts to add
-            alerts_to_add.append(alert)
-            # Add to seen sets to avoid adding duplicates within the new_alerts list itself
-            if alert.hash_id:
-                existing_hashes.add(alert.hash_id)
-            if alert.reference:
-                 existing_references.add(alert.reference)
-
-
-        if not alerts_to_add:
-            logger.info("No new unique alerts to add to Google Sheets.")
-            return 0
+        # Authenticate and open the worksheet in the background, and only once there is something
+        # to write: a run where every alert is already in the local dedup store makes no API calls.
+        # The remaining duplicate checks and building the rows overlap with those round trips.
+        with ThreadPoolExecutor(max_workers=1, thread_name_prefix="sheets-open") as executor:
+            sheet_ready = None
+
+            dedup_sets = self._get_local_dedup_sets(refresh=refresh)
+            if dedup_sets is None:
+                # Cold store or forced refresh: the sheet has to be read first
+                sheet_ready = executor.submit(self._ensure_ready)
+                if not sheet_ready.result():
+                    logger.error("Google Sheets worksheet is not available for updating.")
+                    return 0
+                dedup_sets = self._sync_dedup_sets()
+                if dedup_sets is None:
+                    # Appending without the existing keys would write duplicates, and recording
+                    # them would mark an unsynced store as filled
+                    logger.error("Could not read existing alerts for duplicate checks; not updating Google Sheets.")
+                    return 0
+            existing_hashes, existing_references = dedup_sets
+            near_duplicates = self._near_duplicates
+
+            # Keys from this batch are tracked separately so the cache only ever holds rows that were written
+            added_hashes: Set[str] = set()
+            added_references: Set[str] = set()
+
+            alerts_to_add: List[Alert] = []
+            minhashes = []  # Signatures of alerts_to_add, when near-duplicate detection is on
+            add_hash, add_reference = added_hashes.add, added_references.add
+            for alert in new_alerts:
+                hash_id, reference = alert.hash_id, alert.reference
+                # Check for duplicates based on hash ID and reference. Log arguments are passed
+                # separately so loguru only formats them when DEBUG is enabled.
+                if hash_id and (hash_id in existing_hashes or hash_id in added_hashes):
+                    logger.debug("Skipping alert (duplicate hash): {}", alert.title)
+                    continue
+                if reference and (reference in existing_references or reference in added_references):
+                    logger.debug("Skipping alert (duplicate reference): {}", reference)
+                    continue
+                if near_duplicates:
+                    minhash = near_duplicates.alert_signature(alert)
+                    matches = near_duplicates.query(minhash)
+                    if matches:
+                        match_hash, similarity = matches[0]
+                        logger.info(f"Skipping alert (near-duplicate of {match_hash}, similarity {similarity:.2f}): {reference} - {alert.title}")
+                        continue
+                    minhashes.append(minhash)
+
+                alerts_to_add.append(alert)
+                if sheet_ready is None:
+                    sheet_ready = executor.submit(self._ensure_ready)
+                # Add to seen sets to avoid adding duplicates within the new_alerts list itself
+                if hash_id:
+                    add_hash(hash_id)
+                if reference:
+                    add_reference(reference)
+
+            if not alerts_to_add:
+                logger.info("No new unique alerts to add to Google Sheets.")
+                return 0
+
+            # Build the rows straight from the alerts, in sheet column order
+            data_to_append: List[List[Cell]] = [[fmt(getattr(alert, attr)) for attr, fmt in _HEADER_FIELDS] for alert in alerts_to_add]
+
+            if not sheet_ready.result():
+                logger.error("Google Sheets worksheet is not available for updating.")
+                return 0
 
         logger.info(f"Adding {len(alerts_to_add)} new unique alerts to Google Sheets.")
-
-        # Convert new alerts to DataFrame and then to list of lists for gspread
-        new_alerts_df = self.processor.alerts_to_dataframe(alerts_to_add)
-        # Ensure column order matches the sheet headers
-        headers = [
-            'Reference', 'Title', 'Originator', 'Issue Date', 'Status',
-            'Alert Type', 'Source', 'URL', 'Medical Specialty', 'Scraped At', 'Hash ID'
-        ]
-        new_alerts_df = new_alerts_df.reindex(columns=headers)
-
-        # Convert all datetime-like columns to string to avoid JSON serialization errors
-        import pandas as pd
-        for col in new_alerts_df.columns:
-            if pd.api.types.is_datetime64_any_dtype(new_alerts_df[col]) or new_alerts_df[col].apply(lambda x: hasattr(x, 'isoformat')).any():
-                new_alerts_df[col] = new_alerts_df[col].apply(lambda x: x.isoformat() if hasattr(x, 'isoformat') else str(x))
-
-        # Convert DataFrame to list of lists (excluding header)
-        data_to_append = new_alerts_df.values.tolist()
-
-        try:
-            # Append data to the worksheet
-            from gspread.utils import ValueInputOption
-            self.worksheet.append_rows(data_to_append, value_input_option=ValueInputOption.user_entered)
-            logger.success(f"Successfully added {len(alerts_to_add)} new alerts to Google Sheets.")
-            return len(alerts_to_add)
-
-        except Exception as e:
-            logger.error(f"Error appending data to Google Sheets: {e}")
-            return 0
+        added_count = self._append_with_retry(data_to_append)
+
+        # Only rows that are in the sheet go into the cached dedup sets (updated in place) and the local store
+        written = alerts_to_add[:added_count]
+        written_hashes = [alert.hash_id for alert in written if alert.hash_id]
+        written_references = [alert.reference for alert in written if alert.reference]
+        existing_hashes.update(written_hashes)
+        existing_references.update(written_references)
+        # Written alerts only join the near-duplicate index once they are in the sheet
+        signatures = {}
+        if near_duplicates:
+            for alert, minhash in zip(written, minhashes):
+                if alert.hash_id:
+                    near_duplicates.insert(alert.hash_id, minhash)
+                    signatures[alert.hash_id] = near_duplicates.to_bytes(minhash)
+        if written:
+            self._dedup_store.add(written_hashes, written_references, signatures)
+
+        if added_count == len(alerts_to_add):
+            logger.success(f"Successfully added {added_count} new alerts to Google Sheets.")
+        else:
+            logger.warning(f"Added {added_count} of {len(alerts_to_add)} new alerts to Google Sheets.")
+        return added_count
+
+    def _append_with_retry(self, rows: List[List[Cell]]) -> int:
+        """
+        Append rows in APPEND_CHUNK_ROWS chunks, retrying a chunk with backoff when the API is
+        rate limited or unavailable. Returns the number of rows appended before any failure.
+        """
+        if self._append_url is None:
+            range_label = absolute_range_name(self.worksheet.title)
+            self._append_url = SPREADSHEET_VALUES_APPEND_URL % (self.worksheet.spreadsheet_id, quote(range_label))
+        append_url = self._append_url
+
+        appended = 0
+        for start in range(0, len(rows), APPEND_CHUNK_ROWS):
+            chunk = rows[start:start + APPEND_CHUNK_ROWS]
+            body = _append_body(chunk)  # Serialised once, not on every retry
+            for attempt in range(settings.MAX_RETRIES + 1):
+                try:
+                    # Same request as Worksheet.append_rows
+                    response = self.worksheet.client.request('post', append_url, params=APPEND_PARAMS, **body)
+                    self._update_row_count(response.json(), len(chunk))
+                    break
+                except gspread.exceptions.APIError as e:
+                    status_code = e.response.status_code if e.response is not None else None
+                    if status_code not in RETRYABLE_API_ERRORS or attempt == settings.MAX_RETRIES:
+                        logger.error(f"Error appending data to Google Sheets: {e}")
+                        return appended
+                    delay = min(settings.MAX_BACKOFF_SECONDS, 2 ** attempt + random.random())
+                    logger.info(f"Google Sheets returned {status_code}. Retrying in {delay:.1f}s... ({attempt + 1}/{settings.MAX_RETRIES})")
+                    time.sleep(delay)
+                except Exception as e:
+                    logger.error(f"Error appending data to Google Sheets: {e}")
+                    return appended
+
+            appended += len(chunk)
+
+        return appended
+
+    def _update_row_count(self, append_response: dict, row_count: int):
+        """
+        Grow the worksheet's cached row count after an append, as Worksheet.append_rows does.
+        The handle is shared through _HANDLE_CACHE, so row_count must not go stale.
+        """
+        grid_properties = self.worksheet._properties['gridProperties']
+        updated_range = append_response.get('updates', {}).get('updatedRange')
+        if updated_range:
+            last_row = a1_range_to_grid_range(updated_range.rsplit('!', 1)[-1])['endRowIndex']
+            grid_properties['rowCount'] = max(grid_properties['rowCount'], last_row)
+        else:
+            grid_properties['rowCount'] += row_count
 
     def format_worksheet(self):
         """Apply basic formatting to the worksheet (optional)"""
@@ -200,13 +494,21 @@ class GoogleSheetsManager:
             # self.worksheet.auto_resize_columns()
             # logger.debug("Auto-resized columns.")
 
-            # Set header row bold
-            self.worksheet.format("A1:K1", {"textFormat": {"bold": True}})
-            logger.debug("Formatted header row.")
-
-            # Add filters
-            self.worksheet.set_basic_filter()
-            logger.debug("Added basic filter.")
+            sheet_id = self.worksheet.id
+            # Bold header row and a basic filter over the whole sheet, in one batchUpdate.
+            # These are the requests Worksheet.format and set_basic_filter send one call each.
+            requests = [
+                {
+                    "repeatCell": {
+                        "range": {"sheetId": sheet_id, "startRowIndex": 0, "endRowIndex": 1, "startColumnIndex": 0, "endColumnIndex": len(HEADERS)},
+                        "cell": {"userEnteredFormat": {"textFormat": {"bold": True}}},
+                        "fields": "userEnteredFormat(textFormat)",
+                    }
+                },
+                {"setBasicFilter": {"filter": {"range": {"sheetId": sheet_id}}}},
+            ]
+            self.sheet.batch_update({"requests": requests})
+            logger.debug("Formatted header row and added basic filter.")
 
             logger.info("Applied basic worksheet formatting.")
 
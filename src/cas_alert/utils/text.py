@@ -0,0 +1,11 @@
+"""
+Text normalisation shared by the scrapers and duplicate detection
+"""
+import re
+
+WHITESPACE_PATTERN = re.compile(r'\s+')
+
+
+def collapse_whitespace(text: str) -> str:
+    """Collapse whitespace runs to single spaces and strip the ends, in one pass"""
+    return WHITESPACE_PATTERN.sub(' ', text).strip()
@@ -0,0 +1,71 @@
+"""
+Tests for BaseScraper.fetch_soup
+"""
+import gzip
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+from cas_alert.config import settings
+from cas_alert.scrapers.base import BaseScraper, TokenBucket
+
+PAGE = b"<html><body><h1>Alert detail</h1><p>Action underway</p></body></html>"
+
+
+class GzipHandler(BaseHTTPRequestHandler):
+    """Serves PAGE gzip-encoded, like the alert sites do"""
+
+    def do_GET(self):
+        body = gzip.compress(PAGE)
+        self.send_response(200)
+        self.send_header('Content-Type', 'text/html; charset=utf-8')
+        self.send_header('Content-Encoding', 'gzip')
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+
+class DummyScraper(BaseScraper):
+    def scrape(self):
+        return []
+
+    def enrich_alert_with_detail(self, alert):
+        pass
+
+
+@pytest.fixture
+def gzip_url():
+    server = ThreadingHTTPServer(('127.0.0.1', 0), GzipHandler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield f"http://127.0.0.1:{server.server_address[1]}/alert"
+    server.shutdown()
+    server.server_close()
+
+
+@pytest.fixture
+def scraper(tmp_path, monkeypatch):
+    monkeypatch.setattr(settings, 'BACKUP_DIR', tmp_path)
+    monkeypatch.setattr(settings, 'RATE_LIMIT_PER_SECOND', 0)
+    return DummyScraper()
+
+
+@pytest.mark.parametrize('cache_days', [30, 0])
+def test_fetch_soup_decodes_gzip_responses(scraper, gzip_url, monkeypatch, cache_days):
+    monkeypatch.setattr(settings, 'DETAIL_CACHE_DAYS', cache_days)
+
+    # The first fetch is a cache miss; the second is served from the cache when it is enabled
+    for _ in range(2):
+        soup = scraper.fetch_soup(gzip_url)
+        assert soup.h1.get_text() == 'Alert detail'
+
+
+@pytest.mark.parametrize('capacity', [0, -1])
+def test_token_bucket_with_burst_below_one_still_acquires(capacity):
+    bucket = TokenBucket(capacity, rate=1000)
+    for _ in range(3):
+        bucket.acquire()
@@ -0,0 +1,46 @@
+"""
+Tests for DuplicateManager title similarity at the duplicate threshold
+"""
+from datetime import datetime
+
+import pytest
+from rapidfuzz import fuzz
+
+from cas_alert.data.duplicates import DuplicateManager
+from cas_alert.data.models import Alert
+
+TITLE = "Class 2 Medicines Recall: Accord Healthcare Ltd, Paracetamol 500mg Tablets"
+# Scores 84.56: below 85 unrounded, 85 as fuzzywuzzy's rounded ratio reported it
+NEAR_TITLE = "Class 2 Medicines Recall: Accord Ltd, Paracetamol 500mg Tablets (corrected)"
+
+
+def make_alert(reference: str, title: str) -> Alert:
+    return Alert(
+        reference=reference, title=title, originator='MHRA', issue_date=datetime(2025, 6, 26),
+        status='Active', alert_type='Medicines Recall', source='GOVUK', url=f'https://example.com/{reference}'
+    )
+
+
+@pytest.fixture
+def manager():
+    manager = DuplicateManager()
+    manager.duplicate_threshold = 0.85
+    return manager
+
+
+def test_score_between_84_5_and_85_is_at_the_threshold(manager):
+    score = fuzz.ratio(TITLE.lower(), NEAR_TITLE.lower())
+    assert 84.5 < score < 85
+
+    assert manager.is_duplicate(make_alert('A', TITLE), make_alert('B', NEAR_TITLE))
+    unique = manager.remove_duplicates([make_alert('A', TITLE), make_alert('B', NEAR_TITLE)])
+    assert [alert.reference for alert in unique] == ['A']
+
+
+def test_score_below_84_5_is_not_a_duplicate(manager):
+    other_title = "Class 2 Medicines Recall: Accord HC Ltd, Paracetamol 500mg Tablets (further update)"
+    assert fuzz.ratio(TITLE.lower(), other_title.lower()) < 84.5
+
+    assert not manager.is_duplicate(make_alert('A', TITLE), make_alert('C', other_title))
+    unique = manager.remove_duplicates([make_alert('A', TITLE), make_alert('C', other_title)])
+    assert [alert.reference for alert in unique] == ['A', 'C']